@@ -7,30 +7,49 @@ Start the development server with:
     uvicorn app.main:app --reload
 """
 
+from functools import lru_cache
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app.routers import blocks, feed, follows, likes, posts, shares, users
 
-app = FastAPI(
-    title="Instagram-like API",
-    description="A social media REST API supporting posts, follows, likes, shares and more.",
-    version="0.1.0",
-)
-
-# ---------------------------------------------------------------------------
-# Router registration
-# ---------------------------------------------------------------------------
-
-app.include_router(users.router)
-app.include_router(posts.router)
-app.include_router(follows.router)
-app.include_router(feed.router)
-app.include_router(likes.router)
-app.include_router(shares.router)
-app.include_router(blocks.router)
-
 
-@app.get("/", tags=["health"])
 def health_check():
     """Simple liveness probe."""
     return {"status": "ok", "service": "instagram-like-api"}
+
+
+@lru_cache(maxsize=None)
+def get_app() -> FastAPI:
+    """Build the application and register its routers.
+
+    Cached, so every caller — the module-level ``app`` below, the test
+    suite, an ASGI server — shares one instance and one route table.
+    """
+    application = FastAPI(
+        title="Instagram-like API",
+        description="A social media REST API supporting posts, follows, likes, shares and more.",
+        version="0.1.0",
+        # orjson encodes response bodies in C, well ahead of the stdlib json module.
+        default_response_class=ORJSONResponse,
+    )
+
+    # -----------------------------------------------------------------------
+    # Router registration
+    # -----------------------------------------------------------------------
+
+    application.include_router(users.router)
+    application.include_router(posts.router)
+    application.include_router(follows.router)
+    application.include_router(feed.router)
+    application.include_router(likes.router)
+    application.include_router(shares.router)
+    application.include_router(blocks.router)
+
+    application.add_api_route("/", health_check, methods=["GET"], tags=["health"])
+
+    return application
+
+
+app = get_app()
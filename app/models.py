@@ -6,12 +6,20 @@ Instagram-like API.  All persistence lives here so routers stay thin.
 
 Data stores are module-level singletons — they act as the in-memory
 database for this prototype.
+
+The relationship stores (follows, followers, likes, post_shares, blocks) are
+defaultdicts so write paths can index them directly.  Read paths must use
+``store.get(key, EMPTY)`` instead (``()`` for the list-valued post_shares):
+indexing a defaultdict inserts an empty container for a missing key, which
+would grow shared state on every GET.
 """
 
 from __future__ import annotations
 
 import hashlib
-from typing import Dict, List, Optional, Set
+from collections import defaultdict
+from datetime import datetime
+from typing import DefaultDict, Dict, List, Optional, Set
 
 from pydantic import BaseModel, Field
 
@@ -33,6 +41,18 @@ def hash_password(plain: str) -> str:
     return hashlib.sha256(plain.encode("utf-8")).hexdigest()
 
 
+def now_utc() -> str:
+    """Return the current UTC time as an ISO-8601 string.
+
+    ISO-8601 strings sort lexicographically in time order, which the feed
+    and post listings rely on.  Tests may monkeypatch ``app.models.now_utc``
+    for a deterministic clock; routers call it as ``models.now_utc()`` so the
+    patch reaches records created over HTTP as well as those seeded directly
+    by the test suite.
+    """
+    return datetime.utcnow().isoformat()
+
+
 # ---------------------------------------------------------------------------
 # In-memory data stores
 # ---------------------------------------------------------------------------
@@ -43,35 +63,38 @@ users_db: Dict[str, dict] = {}
 posts_db: Dict[str, dict] = {}
 """Keyed by post_id (UUID string).  Each value is a raw post dict."""
 
-follows: Dict[str, Set[str]] = {}
+EMPTY: frozenset = frozenset()
+"""Shared read-only default for lookups in the set-valued stores below."""
+
+follows: DefaultDict[str, Set[str]] = defaultdict(set)
 """user_id → set of user_ids that *user_id* is following."""
 
-followers: Dict[str, Set[str]] = {}
-"""user_id → set of user_ids who follow *user_id*."""
+followers: DefaultDict[str, Set[str]] = defaultdict(set)
+"""user_id → set of user_ids who follow *user_id*.  The reverse index of
+``follows``; every write to one must be mirrored in the other."""
 
-likes: Dict[str, Set[str]] = {}
+likes: DefaultDict[str, Set[str]] = defaultdict(set)
 """post_id → set of user_ids who have liked the post."""
 
 shares_db: Dict[str, dict] = {}
 """share_id → share record dict."""
 
-post_shares: Dict[str, List[str]] = {}
+post_shares: DefaultDict[str, List[str]] = defaultdict(list)
 """post_id → ordered list of share_ids for that post."""
 
-blocks: Dict[str, Set[str]] = {}
+blocks: DefaultDict[str, Set[str]] = defaultdict(set)
 """user_id → set of user_ids that *user_id* has blocked."""
 
 
+_STORES = (users_db, posts_db, follows, followers, likes, shares_db, post_shares, blocks)
+"""Every in-memory store.  The containers are mutated in place, never rebound,
+because routers import them directly."""
+
+
 def reset_storage() -> None:
-    """Clear all in-memory data stores. Intended for use in tests only."""
-    users_db.clear()
-    posts_db.clear()
-    follows.clear()
-    followers.clear()
-    likes.clear()
-    shares_db.clear()
-    post_shares.clear()
-    blocks.clear()
+    """Clear every in-memory data store.  Intended for use in tests only."""
+    for store in _STORES:
+        store.clear()
 
 
 # ---------------------------------------------------------------------------
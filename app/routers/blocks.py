@@ -15,6 +15,7 @@ from fastapi import APIRouter, HTTPException
 
 from app.models import (
     BlockRequest,
+    EMPTY,
     UserResponse,
     blocks,
     followers,
@@ -46,16 +47,16 @@ def block_user(user_id: str, body: BlockRequest) -> dict:
         raise HTTPException(status_code=400, detail="Cannot block yourself")
 
     # Prevent double-block
-    if body.blocked_user_id in blocks.get(user_id, set()):
+    if body.blocked_user_id in blocks.get(user_id, EMPTY):
         raise HTTPException(status_code=400, detail="Already blocked this user")
 
-    blocks.setdefault(user_id, set()).add(body.blocked_user_id)
+    blocks[user_id].add(body.blocked_user_id)
 
     # Remove follow in both directions
-    follows.setdefault(user_id, set()).discard(body.blocked_user_id)
-    followers.setdefault(body.blocked_user_id, set()).discard(user_id)
-    follows.setdefault(body.blocked_user_id, set()).discard(user_id)
-    followers.setdefault(user_id, set()).discard(body.blocked_user_id)
+    follows[user_id].discard(body.blocked_user_id)
+    followers[body.blocked_user_id].discard(user_id)
+    follows[body.blocked_user_id].discard(user_id)
+    followers[user_id].discard(body.blocked_user_id)
 
     return {"detail": f"User {user_id} has blocked {body.blocked_user_id}"}
 
@@ -66,10 +67,10 @@ def unblock_user(user_id: str, body: BlockRequest) -> dict:
         raise HTTPException(status_code=404, detail="User not found")
 
     # Return 400 if not blocked
-    if body.blocked_user_id not in blocks.get(user_id, set()):
+    if body.blocked_user_id not in blocks.get(user_id, EMPTY):
         raise HTTPException(status_code=400, detail="Not blocking this user")
 
-    blocks.setdefault(user_id, set()).discard(body.blocked_user_id)
+    blocks[user_id].discard(body.blocked_user_id)
 
     return {"detail": f"User {user_id} has unblocked {body.blocked_user_id}"}
 
@@ -79,7 +80,7 @@ def get_blocked(user_id: str) -> List[UserResponse]:
     if user_id not in users_db:
         raise HTTPException(status_code=404, detail="User not found")
 
-    blocked_ids = blocks.get(user_id, set())
+    blocked_ids = blocks.get(user_id, EMPTY)
     result: List[UserResponse] = []
     for bid in blocked_ids:
         user = users_db.get(bid)
@@ -7,11 +7,12 @@ Endpoints:
                                Returns an empty list if the user follows nobody.
 """
 
-from typing import List
+from typing import AbstractSet, List
 
 from fastapi import APIRouter, HTTPException
 
 from app.models import (
+    EMPTY,
     PostResponse,
     blocks,
     follows,
@@ -43,21 +44,22 @@ def get_feed(user_id: str) -> List[PostResponse]:
     if user_id not in users_db:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # follows is Dict[str, Set[str]]: user_id -> set of following_ids
-    following_ids: set[str] = follows.get(user_id, set())
+    # follows is DefaultDict[str, Set[str]]: user_id -> set of following_ids
+    following_ids: AbstractSet[str] = follows.get(user_id, EMPTY)
 
     if not following_ids:
         return []
 
-    # blocks is Dict[str, Set[str]]: user_id -> set of blocked_ids
-    blocked_ids: set[str] = blocks.get(user_id, set())
+    # blocks is DefaultDict[str, Set[str]]: user_id -> set of blocked_ids
+    blocked_ids: AbstractSet[str] = blocks.get(user_id, EMPTY)
 
-    # Gather eligible posts: authored by a followed user AND not from a blocked user
-    feed_posts = [
-        post
-        for post in posts_db.values()
-        if post["user_id"] in following_ids and post["user_id"] not in blocked_ids
-    ]
+    # Eligible authors: followed AND not blocked.  One set difference up front
+    # leaves a single membership test per post in the scan below.
+    author_ids = following_ids - blocked_ids if blocked_ids else following_ids
+    if not author_ids:
+        return []
+
+    feed_posts = [post for post in posts_db.values() if post["user_id"] in author_ids]
 
     # Sort newest first — ISO-8601 strings are lexicographically sortable
     feed_posts.sort(key=lambda p: p["created_at"], reverse=True)
@@ -15,6 +15,7 @@ from typing import List
 from fastapi import APIRouter, HTTPException
 
 from app.models import (
+    EMPTY,
     FollowRequest,
     UserResponse,
     blocks,
@@ -48,17 +49,17 @@ def follow_user(user_id: str, body: FollowRequest) -> dict:
         raise HTTPException(status_code=400, detail="Cannot follow yourself")
 
     # Block check — 403 when blocked
-    if user_id in blocks.get(body.follower_id, set()):
+    if user_id in blocks.get(body.follower_id, EMPTY):
         raise HTTPException(status_code=403, detail="Cannot follow a user you have blocked")
-    if body.follower_id in blocks.get(user_id, set()):
+    if body.follower_id in blocks.get(user_id, EMPTY):
         raise HTTPException(status_code=403, detail="Cannot follow a user who has blocked you")
 
     # Prevent double-follow
-    if user_id in follows.get(body.follower_id, set()):
+    if user_id in follows.get(body.follower_id, EMPTY):
         raise HTTPException(status_code=400, detail="Already following this user")
 
-    follows.setdefault(body.follower_id, set()).add(user_id)
-    followers.setdefault(user_id, set()).add(body.follower_id)
+    follows[body.follower_id].add(user_id)
+    followers[user_id].add(body.follower_id)
 
     return {"detail": f"User {body.follower_id} is now following {user_id}"}
 
@@ -71,11 +72,11 @@ def unfollow_user(user_id: str, body: FollowRequest) -> dict:
         raise HTTPException(status_code=404, detail="Follower user not found")
 
     # Return 400 if not following
-    if user_id not in follows.get(body.follower_id, set()):
+    if user_id not in follows.get(body.follower_id, EMPTY):
         raise HTTPException(status_code=400, detail="Not following this user")
 
-    follows.setdefault(body.follower_id, set()).discard(user_id)
-    followers.setdefault(user_id, set()).discard(body.follower_id)
+    follows[body.follower_id].discard(user_id)
+    followers[user_id].discard(body.follower_id)
 
     return {"detail": f"User {body.follower_id} has unfollowed {user_id}"}
 
@@ -85,7 +86,7 @@ def get_followers(user_id: str) -> List[UserResponse]:
     if user_id not in users_db:
         raise HTTPException(status_code=404, detail="User not found")
 
-    follower_ids = followers.get(user_id, set())
+    follower_ids = followers.get(user_id, EMPTY)
     result: List[UserResponse] = []
     for fid in follower_ids:
         user = users_db.get(fid)
@@ -99,7 +100,7 @@ def get_following(user_id: str) -> List[UserResponse]:
     if user_id not in users_db:
         raise HTTPException(status_code=404, detail="User not found")
 
-    following_ids = follows.get(user_id, set())
+    following_ids = follows.get(user_id, EMPTY)
     result: List[UserResponse] = []
     for fid in following_ids:
         user = users_db.get(fid)
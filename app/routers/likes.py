@@ -14,6 +14,7 @@ from typing import Dict, List, Union
 from fastapi import APIRouter, HTTPException
 
 from app.models import (
+    EMPTY,
     LikeRequest,
     blocks,
     likes,
@@ -34,14 +35,14 @@ def like_post(post_id: str, body: LikeRequest) -> Dict[str, Union[str, int]]:
 
     # Block enforcement: 403 if post owner has blocked this user
     post_owner = post["user_id"]
-    if body.user_id in blocks.get(post_owner, set()):
+    if body.user_id in blocks.get(post_owner, EMPTY):
         raise HTTPException(status_code=403, detail="Cannot like post — you are blocked by the post owner")
 
     # Prevent double-like
-    if body.user_id in likes.get(post_id, set()):
+    if body.user_id in likes.get(post_id, EMPTY):
         raise HTTPException(status_code=400, detail="Already liked this post")
 
-    likes.setdefault(post_id, set()).add(body.user_id)
+    likes[post_id].add(body.user_id)
     post["like_count"] = len(likes[post_id])
 
     return {"post_id": post_id, "like_count": post["like_count"]}
@@ -54,10 +55,10 @@ def unlike_post(post_id: str, body: LikeRequest) -> Dict[str, Union[str, int]]:
         raise HTTPException(status_code=404, detail="Post not found")
 
     # Return 400 if not liked
-    if body.user_id not in likes.get(post_id, set()):
+    if body.user_id not in likes.get(post_id, EMPTY):
         raise HTTPException(status_code=400, detail="Not liked this post")
 
-    likes.setdefault(post_id, set()).discard(body.user_id)
+    likes[post_id].discard(body.user_id)
     post["like_count"] = len(likes[post_id])
 
     return {"post_id": post_id, "like_count": post["like_count"]}
@@ -68,7 +69,7 @@ def get_likes(post_id: str) -> Dict[str, Union[str, int, List[str]]]:
     if post_id not in posts_db:
         raise HTTPException(status_code=404, detail="Post not found")
 
-    user_ids: List[str] = list(likes.get(post_id, set()))
+    user_ids: List[str] = list(likes.get(post_id, EMPTY))
     return {
         "post_id": post_id,
         "like_count": len(user_ids),
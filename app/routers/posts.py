@@ -10,11 +10,11 @@ Endpoints:
 """
 
 import uuid
-from datetime import datetime
 from typing import List
 
 from fastapi import APIRouter, HTTPException
 
+from app import models
 from app.models import (
     ALLOWED_MEDIA_TYPES,
     PostCreate,
@@ -86,7 +86,7 @@ def create_post(body: PostCreate) -> PostResponse:
         "media_url": body.media_url,
         "media_type": body.media_type,
         "caption": body.caption,
-        "created_at": datetime.utcnow().isoformat(),
+        "created_at": models.now_utc(),
         "like_count": 0,
         "share_count": 0,
     }
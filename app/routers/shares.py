@@ -9,12 +9,13 @@ Endpoints:
 """
 
 import uuid
-from datetime import datetime
 from typing import Dict, List, Union
 
 from fastapi import APIRouter, HTTPException
 
+from app import models
 from app.models import (
+    EMPTY,
     ShareRequest,
     ShareResponse,
     blocks,
@@ -46,11 +47,11 @@ def share_post(post_id: str, body: ShareRequest) -> ShareResponse:
 
     # Block enforcement: 403 if post owner has blocked this user
     post_owner = post["user_id"]
-    if body.user_id in blocks.get(post_owner, set()):
+    if body.user_id in blocks.get(post_owner, EMPTY):
         raise HTTPException(status_code=403, detail="Cannot share post — you are blocked by the post owner")
 
     share_id = str(uuid.uuid4())
-    created_at = datetime.utcnow().isoformat()
+    created_at = models.now_utc()
 
     share_dict: dict = {
         "id": share_id,
@@ -60,7 +61,7 @@ def share_post(post_id: str, body: ShareRequest) -> ShareResponse:
     }
 
     shares_db[share_id] = share_dict
-    post_shares.setdefault(post_id, []).append(share_id)
+    post_shares[post_id].append(share_id)
     post["share_count"] = len(post_shares[post_id])
 
     return _share_to_response(share_dict)
@@ -71,7 +72,7 @@ def get_shares(post_id: str) -> Dict[str, Union[str, int, List[dict]]]:
     if post_id not in posts_db:
         raise HTTPException(status_code=404, detail="Post not found")
 
-    share_ids = post_shares.get(post_id, [])
+    share_ids = post_shares.get(post_id, ())
     share_list = [
         _share_to_response(shares_db[sid]).model_dump()
         for sid in share_ids
@@ -11,11 +11,12 @@ Endpoints:
 """
 
 import uuid
-from datetime import datetime
 
 from fastapi import APIRouter, HTTPException
 
+from app import models
 from app.models import (
+    EMPTY,
     UserCreate,
     UserProfileResponse,
     UserResponse,
@@ -59,7 +60,7 @@ def register_user(body: UserCreate) -> UserResponse:
         "password_hash": hash_password(body.password),
         "display_name": body.display_name,
         "bio": None,
-        "created_at": datetime.utcnow().isoformat(),
+        "created_at": models.now_utc(),
     }
     users_db[user_id] = user_dict
     return UserResponse(
@@ -91,10 +92,10 @@ def get_user(user_id: str) -> UserProfileResponse:
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # follows is Dict[str, Set[str]]: user_id -> set of IDs they follow
-    # followers is Dict[str, Set[str]]: user_id -> set of IDs who follow them
-    follower_count = len(followers.get(user_id, set()))
-    following_count = len(follows.get(user_id, set()))
+    # follows is DefaultDict[str, Set[str]]: user_id -> set of IDs they follow;
+    # followers is the reverse index: user_id -> set of IDs who follow them.
+    follower_count = len(followers.get(user_id, EMPTY))
+    following_count = len(follows.get(user_id, EMPTY))
     post_count = sum(1 for p in posts_db.values() if p["user_id"] == user_id)
 
     return UserProfileResponse(
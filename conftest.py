@@ -0,0 +1,14 @@
+"""
+conftest.py
+───────────
+Root pytest configuration.
+
+The suite runs with ``--import-mode=importlib`` (see ``pyproject.toml``), which
+does not touch ``sys.path``.  Put the repository root on it once here so the
+top-level packages (``app``, ``src``, ``uber_app`` …) resolve from any test file.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
@@ -16,10 +16,15 @@ def clear_storage():
     reset_storage()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client() -> TestClient:
-    """Return a FastAPI test client wired to the Slack app."""
-    return TestClient(app)
+    """Return a FastAPI test client wired to the Slack app, shared by the whole session.
+
+    Storage is reset per test by clear_storage; the client itself holds no
+    per-test state, so it is built (and its lifespan entered) only once.
+    """
+    with TestClient(app) as c:
+        yield c
 
 
 @pytest.fixture
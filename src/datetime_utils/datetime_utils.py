@@ -3,6 +3,22 @@ datetime_utils.py — Date and time utilities module.
 """
 
 from datetime import datetime, date, timedelta
+from functools import lru_cache
+
+
+_ISO_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"   # ISO 8601 with time
+_ISO_DATE_FORMAT = "%Y-%m-%d"                # ISO 8601
+_ABBREVIATED_MONTH_FORMAT = "%b %d %Y"       # Abbreviated month: Jan 15 2025
+_FULL_MONTH_FORMAT = "%B %d, %Y"             # Full month with comma: January 15, 2025
+_EUROPEAN_FORMAT = "%d/%m/%Y"                # DD/MM/YYYY (European)
+
+_DATE_FORMATS = (
+    _ISO_DATETIME_FORMAT,
+    _ISO_DATE_FORMAT,
+    _ABBREVIATED_MONTH_FORMAT,
+    _FULL_MONTH_FORMAT,
+    _EUROPEAN_FORMAT,
+)
 
 
 def format_duration(seconds: int) -> str:
@@ -40,37 +56,24 @@ def format_duration(seconds: int) -> str:
     if seconds == 0:
         return "0s"
 
-    # Calculate time units
-    days = seconds // 86400
-    remainder = seconds % 86400
-
-    hours = remainder // 3600
-    remainder = remainder % 3600
-
-    minutes = remainder // 60
-    secs = remainder % 60
-
-    # Build result based on the highest unit present
-    parts = []
-
-    if days > 0:
-        parts.append(f"{days}d")
-        parts.append(f"{hours}h")
-        parts.append(f"{minutes}m")
-        parts.append(f"{secs}s")
-    elif hours > 0:
-        parts.append(f"{hours}h")
-        parts.append(f"{minutes}m")
-        parts.append(f"{secs}s")
-    elif minutes > 0:
-        parts.append(f"{minutes}m")
-        parts.append(f"{secs}s")
-    else:
-        parts.append(f"{secs}s")
+    # Fast path: under a day, so at most hours/minutes/seconds appear
+    if seconds < 86400:
+        hours, remainder = divmod(seconds, 3600)
+        minutes, secs = divmod(remainder, 60)
+        if hours:
+            return f"{hours}h {minutes}m {secs}s"
+        if minutes:
+            return f"{minutes}m {secs}s"
+        return f"{secs}s"
 
-    return " ".join(parts)
+    # Days present: all lower units are shown, including zeros
+    days, remainder = divmod(seconds, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, secs = divmod(remainder, 60)
+    return f"{days}d {hours}h {minutes}m {secs}s"
 
 
+@lru_cache(maxsize=1024)
 def parse_date(text: str) -> datetime:
     """
     Parse various date string formats into a datetime object.
@@ -82,6 +85,9 @@ def parse_date(text: str) -> datetime:
     - Full month with comma: 'January 15, 2025'
     - DD/MM/YYYY (European): '15/01/2025'
 
+    Results are memoized per input string; datetime objects are immutable,
+    so repeated calls safely share the cached instance.
+
     Args:
         text: The date string to parse.
 
@@ -99,15 +105,28 @@ def parse_date(text: str) -> datetime:
         >>> parse_date('Jan 15 2025')
         datetime.datetime(2025, 1, 15, 0, 0)
     """
-    formats = [
-        "%Y-%m-%dT%H:%M:%S",  # ISO 8601 with time
-        "%Y-%m-%d",            # ISO 8601
-        "%b %d %Y",            # Abbreviated month: Jan 15 2025
-        "%B %d, %Y",           # Full month with comma: January 15, 2025
-        "%d/%m/%Y",            # DD/MM/YYYY (European)
-    ]
-
-    for fmt in formats:
+    # The formats are structurally disjoint, so a cheap look at the text
+    # picks the only one that can match; try it before the full cascade.
+    if text[:1].isdigit():
+        if "T" in text:
+            guess = _ISO_DATETIME_FORMAT
+        elif "/" in text:
+            guess = _EUROPEAN_FORMAT
+        else:
+            guess = _ISO_DATE_FORMAT
+    elif "," in text:
+        guess = _FULL_MONTH_FORMAT
+    else:
+        guess = _ABBREVIATED_MONTH_FORMAT
+
+    try:
+        return datetime.strptime(text, guess)
+    except ValueError:
+        pass
+
+    for fmt in _DATE_FORMATS:
+        if fmt == guess:
+            continue
         try:
             return datetime.strptime(text, fmt)
         except ValueError:
@@ -116,6 +135,11 @@ def parse_date(text: str) -> datetime:
     raise ValueError(f"Unable to parse date: '{text}'")
 
 
+def _today() -> date:
+    """Return the current local date. Isolated so tests can pin "today"."""
+    return date.today()
+
+
 def days_until(target: date) -> int:
     """
     Calculate the number of days from today to a target date.
@@ -133,9 +157,7 @@ def days_until(target: date) -> int:
         >>> days_until(date.today() + timedelta(days=5))
         5
     """
-    today = date.today()
-    delta = target - today
-    return delta.days
+    return (target - _today()).days
 
 
 def business_days_between(start: date, end: date) -> int:
@@ -166,13 +188,15 @@ def business_days_between(start: date, end: date) -> int:
     if start > end:
         raise ValueError("start date must be less than or equal to end date")
 
-    count = 0
-    current = start
+    # Every run of 7 consecutive days holds exactly 5 weekdays, so only the
+    # trailing partial week (at most 6 days) needs inspecting.
+    full_weeks, remainder = divmod((end - start).days + 1, 7)
+    count = full_weeks * 5
 
-    while current <= end:
-        # weekday() returns 0-6 where 0=Monday, 6=Sunday
-        if current.weekday() < 5:  # 0-4 are Mon-Fri
+    # weekday() returns 0-6 where 0=Monday, 6=Sunday; 0-4 are Mon-Fri
+    start_weekday = start.weekday()
+    for offset in range(remainder):
+        if (start_weekday + offset) % 7 < 5:
             count += 1
-        current += timedelta(days=1)
 
     return count
@@ -3,13 +3,51 @@ fibonacci.py — Fibonacci number calculation module.
 """
 
 
+def _fib_doubling(n: int) -> int:
+    """
+    Return F(n) using the fast-doubling identities.
+
+        F(2k)   = F(k) * (2 * F(k+1) - F(k))
+        F(2k+1) = F(k)^2 + F(k+1)^2
+
+    Walks the bits of n from the most significant end, keeping the pair
+    (F(k), F(k+1)) in locals, so it needs O(log n) big-integer
+    multiplications and no recursion.
+    """
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * ((b << 1) - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a
+
+
+def _precompute(limit: int) -> tuple[int, ...]:
+    """Return the tuple (F(0), F(1), ..., F(limit)) built by plain iteration."""
+    a, b, out = 0, 1, [0]
+    for _ in range(limit):
+        out.append(b)
+        a, b = b, a + b
+    return tuple(out)
+
+
+# F(0)..F(92): every Fibonacci number that fits in a signed 64-bit integer.
+# Small indices are by far the most common queries, so they are served
+# straight from this table without any arithmetic.
+_FIB92 = _precompute(92)
+
+
 def fibonacci(n: int) -> int:
     """
-    Calculate the nth Fibonacci number using iterative approach.
+    Calculate the nth Fibonacci number using the fast-doubling method.
 
     Returns the nth Fibonacci number using 0-indexed convention where
     F(0) = 0, F(1) = 1, and F(n) = F(n-1) + F(n-2) for n > 1.
-    Uses an iterative implementation for efficiency.
+    Indices up to 92 are answered from a precomputed table; larger ones run
+    in O(log n) arithmetic steps, so very large indices stay cheap.
 
     Args:
         n: The index of the Fibonacci number to calculate (must be non-negative integer).
@@ -36,22 +74,15 @@ def fibonacci(n: int) -> int:
     # Check type first: reject floats, strings, etc.
     # Note: bool is a subclass of int in Python, so isinstance(True, int) is True
     # We accept bools as valid input per the requirements
-    if not isinstance(n, int):
+    # The exact-type check is a single pointer compare for the common case;
+    # isinstance only runs for non-int types and int subclasses such as bool.
+    if type(n) is not int and not isinstance(n, int):
         raise TypeError(f"fibonacci() argument must be an integer, not {type(n).__name__}")
 
     # Check for negative values
     if n < 0:
         raise ValueError("fibonacci() argument must be non-negative")
 
-    # Base cases
-    if n == 0:
-        return 0
-    if n == 1:
-        return 1
-
-    # Iterative calculation for n >= 2
-    prev, curr = 0, 1
-    for _ in range(2, n + 1):
-        prev, curr = curr, prev + curr
-
-    return curr
+    if n < len(_FIB92):
+        return _FIB92[n]
+    return _fib_doubling(n)
@@ -4,6 +4,13 @@ string_utils.py — String manipulation utilities module.
 
 import re
 
+# Characters slugify() removes outright (separators are handled separately).
+_SLUG_DROP_RE = re.compile(r"[^a-z0-9\s_\-]+")
+# Translation table mapping the non-whitespace separators to a space.
+_SLUG_SEPARATORS = str.maketrans("_-", "  ")
+# Words title_case() leaves lowercase unless they start the text.
+_TITLE_SMALL_WORDS = frozenset({"a", "an", "the", "in", "on", "at", "for", "to", "of"})
+
 
 def truncate(text: str, max_len: int, suffix: str = "...") -> str:
     """
@@ -30,12 +37,13 @@ def truncate(text: str, max_len: int, suffix: str = "...") -> str:
     if len(text) <= max_len:
         return text
 
-    # If max_len <= len(suffix), return truncated suffix
-    if max_len <= len(suffix):
+    # Keep as many chars from text as the suffix leaves room for
+    available_len = max_len - len(suffix)
+
+    # No room left for text: return truncated suffix
+    if available_len <= 0:
         return suffix[:max_len]
 
-    # Calculate how many chars from text we can keep
-    available_len = max_len - len(suffix)
     return text[:available_len] + suffix
 
 
@@ -59,22 +67,12 @@ def slugify(text: str) -> str:
         >>> slugify("__Hello__World__")
         'hello-world'
     """
-    # Convert to lowercase
-    slug = text.lower()
-
-    # Replace spaces and underscores with hyphens
-    slug = re.sub(r"[\s_]+", "-", slug)
+    # Drop everything that is not alphanumeric, whitespace, "_" or "-"
+    slug = _SLUG_DROP_RE.sub("", text.lower())
 
-    # Remove all characters that are not alphanumeric or hyphens
-    slug = re.sub(r"[^a-z0-9\-]", "", slug)
-
-    # Collapse consecutive hyphens to a single hyphen
-    slug = re.sub(r"-+", "-", slug)
-
-    # Strip leading and trailing hyphens
-    slug = slug.strip("-")
-
-    return slug
+    # Treat "_" and "-" as whitespace, then split/join: this collapses every
+    # separator run to one hyphen and strips leading/trailing ones in C.
+    return "-".join(slug.translate(_SLUG_SEPARATORS).split())
 
 
 def count_words(text: str) -> int:
@@ -115,23 +113,14 @@ def title_case(text: str) -> str:
         >>> title_case("alice in wonderland")
         'Alice in Wonderland'
     """
-    small_words = {"a", "an", "the", "in", "on", "at", "for", "to", "of"}
-
     words = text.split()
     if not words:
         return text
 
-    # Process each word
-    result = []
-    for i, word in enumerate(words):
-        if i == 0:
-            # First word is always capitalized
-            result.append(word.capitalize())
-        elif word.lower() in small_words:
-            # Small word not at the start stays lowercase
-            result.append(word.lower())
-        else:
-            # Regular word is capitalized
-            result.append(word.capitalize())
+    # First word is always capitalized; later small words stay lowercase.
+    result = [words[0].capitalize()]
+    for word in words[1:]:
+        lowered = word.lower()
+        result.append(lowered if lowered in _TITLE_SMALL_WORDS else word.capitalize())
 
     return " ".join(result)
@@ -14,10 +14,11 @@ Scaling features:
 
 import random
 import string
+from urllib.parse import quote
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse, Response
 
 from src.url_shortener.models import ShortenRequest, ShortenResponse, StatsResponse
 from src.url_shortener import storage
@@ -35,10 +36,16 @@ app = FastAPI(
 # ---------------------------------------------------------------------------
 # Middleware — token-bucket rate limiting: 100 req/min per IP
 # ---------------------------------------------------------------------------
-app.add_middleware(RateLimitMiddleware, rate_limit=100, window_seconds=60.0)
+# The instance registers itself as app.state.rate_limiter once the middleware
+# stack is built (on the first request or lifespan startup).
+app.add_middleware(
+    RateLimitMiddleware, rate_limit=100, window_seconds=60.0, state=app.state
+)
 
 _SHORT_CODE_LENGTH: int = 7
 _ALPHABET: str = string.ascii_letters + string.digits
+# Characters left unescaped in the Location header (same set as RedirectResponse).
+_LOCATION_SAFE: str = ":/%#?=@[]!$&'()*+,;"
 
 
 # ---------------------------------------------------------------------------
@@ -200,7 +207,7 @@ def get_stats(short_code: str) -> StatsResponse:
         404: {"description": "Short code not found"},
     },
 )
-def redirect_to_url(short_code: str) -> RedirectResponse:
+def redirect_to_url(short_code: str) -> Response:
     """Look up a short code and issue a 301 redirect to the original URL.
 
     Uses the LRU cache in the storage layer for the hot-path URL lookup,
@@ -210,7 +217,7 @@ def redirect_to_url(short_code: str) -> RedirectResponse:
         short_code: The short code to resolve.
 
     Returns:
-        A 301 RedirectResponse pointing to the original URL.
+        A 301 response whose Location header points to the original URL.
 
     Raises:
         HTTPException 404: If the short code is not found.
@@ -221,4 +228,7 @@ def redirect_to_url(short_code: str) -> RedirectResponse:
         raise HTTPException(status_code=404, detail="Short code not found")
 
     storage.increment_clicks(short_code)
-    return RedirectResponse(url=original_url, status_code=301)
+    # Build the 301 directly: RedirectResponse would construct its headers
+    # and then set Location a second time.  Quoting matches RedirectResponse.
+    location = quote(original_url, safe=_LOCATION_SAFE)
+    return Response(status_code=301, headers={"location": location})
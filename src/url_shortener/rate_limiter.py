@@ -27,6 +27,7 @@ import threading
 import time
 from typing import Callable
 
+from starlette.datastructures import State
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 from starlette.types import ASGIApp, Receive, Scope, Send
@@ -49,6 +50,10 @@ class TokenBucket:
         refill_rate:    Tokens added per second.
     """
 
+    # Clock used for refill arithmetic.  A class attribute so tests can swap
+    # in a fake monotonic clock instead of sleeping.
+    _time: Callable[[], float] = staticmethod(time.monotonic)
+
     def __init__(self, capacity: float, refill_rate: float) -> None:
         if capacity <= 0:
             raise ValueError(f"capacity must be > 0, got {capacity}")
@@ -58,7 +63,7 @@ class TokenBucket:
         self._capacity: float = capacity
         self._refill_rate: float = refill_rate  # tokens / second
         self._tokens: float = float(capacity)   # start full
-        self._last_refill: float = time.monotonic()
+        self._last_refill: float = self._time()
         self._lock: threading.Lock = threading.Lock()
 
     # ------------------------------------------------------------------
@@ -100,7 +105,7 @@ class TokenBucket:
 
         Must be called while holding ``self._lock``.
         """
-        now = time.monotonic()
+        now = self._time()
         elapsed = now - self._last_refill
         added = elapsed * self._refill_rate
         self._tokens = min(self._capacity, self._tokens + added)
@@ -120,6 +125,10 @@ class RateLimitMiddleware:
         app:            The wrapped ASGI application.
         rate_limit:     Max requests per *window_seconds* (default 100).
         window_seconds: Window length in seconds (default 60).
+        state:          Optional application ``State``; when given, the
+                        instance registers itself as ``state.rate_limiter``
+                        so callers can reach it without walking the ASGI
+                        middleware stack.
     """
 
     def __init__(
@@ -127,6 +136,7 @@ class RateLimitMiddleware:
         app: ASGIApp,
         rate_limit: int = RATE_LIMIT,
         window_seconds: float = WINDOW_SECONDS,
+        state: State | None = None,
     ) -> None:
         self._app = app
         self._rate_limit = rate_limit
@@ -135,6 +145,8 @@ class RateLimitMiddleware:
         self._refill_rate: float = rate_limit / window_seconds
         self._buckets: dict[str, TokenBucket] = {}
         self._lock: threading.Lock = threading.Lock()
+        if state is not None:
+            state.rate_limiter = self
 
     # ------------------------------------------------------------------
     # ASGI interface
@@ -216,6 +228,13 @@ class RateLimitMiddleware:
     # ------------------------------------------------------------------
 
     def reset(self) -> None:
-        """Clear all bucket state.  **For use in tests only.**"""
+        """Clear all bucket state.  **For use in tests only.**
+
+        Buckets only come into existence on traffic, so an empty dict means
+        nothing touched the middleware since the last reset and the lock can
+        be skipped.
+        """
+        if not self._buckets:
+            return
         with self._lock:
             self._buckets.clear()
@@ -66,8 +66,12 @@ def _cache_put(short_code: str, original_url: str) -> None:
     """
     if short_code in _url_cache:
         _url_cache.move_to_end(short_code)
+        _url_cache[short_code] = original_url
+        return
+    # New entry: a single write, evicting only if the cache was already full.
+    full = len(_url_cache) >= _LRU_CAPACITY
     _url_cache[short_code] = original_url
-    if len(_url_cache) > _LRU_CAPACITY:
+    if full:
         _url_cache.popitem(last=False)  # drop LRU entry
 
 
@@ -2,30 +2,25 @@
 
 import pytest
 from fastapi.testclient import TestClient
-from fastapi import FastAPI
-from pydantic import BaseModel
-from typing import Literal
 
+from calculator_app import app
 
-# Import app by reading the app.py file to avoid package import conflict
-import sys
-import importlib.util
-from pathlib import Path
 
-app_path = Path(__file__).parent / "app.py"
-spec = importlib.util.spec_from_file_location("app_calculator", app_path)
-app_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(app_module)
-app = app_module.app
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    """Return a TestClient for the calculator app, entered once per module.
 
-
-client = TestClient(app)
+    Using the client as a context manager runs the app's lifespan once, at
+    fixture setup, rather than at import time outside pytest's control.
+    """
+    with TestClient(app) as c:
+        yield c
 
 
 class TestAddOperation:
     """Tests for the add operation."""
 
-    def test_add_positive_numbers(self) -> None:
+    def test_add_positive_numbers(self, client: TestClient) -> None:
         """Test adding two positive numbers."""
         response = client.post(
             "/calculate",
@@ -34,7 +29,7 @@ class TestAddOperation:
         assert response.status_code == 200
         assert response.json() == {"result": 3.0}
 
-    def test_add_with_floats(self) -> None:
+    def test_add_with_floats(self, client: TestClient) -> None:
         """Test adding floating point numbers."""
         response = client.post(
             "/calculate",
@@ -43,7 +38,7 @@ class TestAddOperation:
         assert response.status_code == 200
         assert response.json() == {"result": 4.0}
 
-    def test_add_negative_numbers(self) -> None:
+    def test_add_negative_numbers(self, client: TestClient) -> None:
         """Test adding negative numbers: -5 + 3 = -2."""
         response = client.post(
             "/calculate",
@@ -52,7 +47,7 @@ class TestAddOperation:
         assert response.status_code == 200
         assert response.json() == {"result": -2.0}
 
-    def test_add_with_zero(self) -> None:
+    def test_add_with_zero(self, client: TestClient) -> None:
         """Test adding with zero."""
         response = client.post(
             "/calculate",
@@ -65,7 +60,7 @@ class TestAddOperation:
 class TestSubtractOperation:
     """Tests for the subtract operation."""
 
-    def test_subtract_positive_numbers(self) -> None:
+    def test_subtract_positive_numbers(self, client: TestClient) -> None:
         """Test subtracting two positive numbers: 5 - 3 = 2."""
         response = client.post(
             "/calculate",
@@ -74,7 +69,7 @@ class TestSubtractOperation:
         assert response.status_code == 200
         assert response.json() == {"result": 2.0}
 
-    def test_subtract_resulting_negative(self) -> None:
+    def test_subtract_resulting_negative(self, client: TestClient) -> None:
         """Test subtraction resulting in a negative number."""
         response = client.post(
             "/calculate",
@@ -83,7 +78,7 @@ class TestSubtractOperation:
         assert response.status_code == 200
         assert response.json() == {"result": -2.0}
 
-    def test_subtract_with_floats(self) -> None:
+    def test_subtract_with_floats(self, client: TestClient) -> None:
         """Test subtracting floating point numbers."""
         response = client.post(
             "/calculate",
@@ -92,7 +87,7 @@ class TestSubtractOperation:
         assert response.status_code == 200
         assert response.json() == {"result": 3.0}
 
-    def test_subtract_with_zero(self) -> None:
+    def test_subtract_with_zero(self, client: TestClient) -> None:
         """Test subtracting zero."""
         response = client.post(
             "/calculate",
@@ -105,7 +100,7 @@ class TestSubtractOperation:
 class TestMultiplyOperation:
     """Tests for the multiply operation."""
 
-    def test_multiply_positive_numbers(self) -> None:
+    def test_multiply_positive_numbers(self, client: TestClient) -> None:
         """Test multiplying two positive numbers: 4 * 3 = 12."""
         response = client.post(
             "/calculate",
@@ -114,7 +109,7 @@ class TestMultiplyOperation:
         assert response.status_code == 200
         assert response.json() == {"result": 12.0}
 
-    def test_multiply_with_negative(self) -> None:
+    def test_multiply_with_negative(self, client: TestClient) -> None:
         """Test multiplying with a negative number."""
         response = client.post(
             "/calculate",
@@ -123,7 +118,7 @@ class TestMultiplyOperation:
         assert response.status_code == 200
         assert response.json() == {"result": -12.0}
 
-    def test_multiply_by_zero(self) -> None:
+    def test_multiply_by_zero(self, client: TestClient) -> None:
         """Test multiplying by zero."""
         response = client.post(
             "/calculate",
@@ -132,7 +127,7 @@ class TestMultiplyOperation:
         assert response.status_code == 200
         assert response.json() == {"result": 0.0}
 
-    def test_multiply_with_floats(self) -> None:
+    def test_multiply_with_floats(self, client: TestClient) -> None:
         """Test multiplying floating point numbers."""
         response = client.post(
             "/calculate",
@@ -141,7 +136,7 @@ class TestMultiplyOperation:
         assert response.status_code == 200
         assert response.json() == {"result": 10.0}
 
-    def test_multiply_two_negative_numbers(self) -> None:
+    def test_multiply_two_negative_numbers(self, client: TestClient) -> None:
         """Test multiplying two negative numbers."""
         response = client.post(
             "/calculate",
@@ -154,7 +149,7 @@ class TestMultiplyOperation:
 class TestErrorHandling:
     """Tests for error handling and invalid inputs."""
 
-    def test_invalid_operation_returns_422(self) -> None:
+    def test_invalid_operation_returns_422(self, client: TestClient) -> None:
         """Test that an invalid operation returns 422 Unprocessable Entity."""
         response = client.post(
             "/calculate",
@@ -162,7 +157,7 @@ class TestErrorHandling:
         )
         assert response.status_code == 422
 
-    def test_missing_operation_field_returns_422(self) -> None:
+    def test_missing_operation_field_returns_422(self, client: TestClient) -> None:
         """Test that missing operation field returns 422."""
         response = client.post(
             "/calculate",
@@ -170,7 +165,7 @@ class TestErrorHandling:
         )
         assert response.status_code == 422
 
-    def test_missing_a_field_returns_422(self) -> None:
+    def test_missing_a_field_returns_422(self, client: TestClient) -> None:
         """Test that missing 'a' field returns 422."""
         response = client.post(
             "/calculate",
@@ -178,7 +173,7 @@ class TestErrorHandling:
         )
         assert response.status_code == 422
 
-    def test_missing_b_field_returns_422(self) -> None:
+    def test_missing_b_field_returns_422(self, client: TestClient) -> None:
         """Test that missing 'b' field returns 422."""
         response = client.post(
             "/calculate",
@@ -186,7 +181,7 @@ class TestErrorHandling:
         )
         assert response.status_code == 422
 
-    def test_invalid_operation_modulo(self) -> None:
+    def test_invalid_operation_modulo(self, client: TestClient) -> None:
         """Test that modulo operation (not allowed) returns 422."""
         response = client.post(
             "/calculate",
@@ -194,7 +189,7 @@ class TestErrorHandling:
         )
         assert response.status_code == 422
 
-    def test_invalid_operation_power(self) -> None:
+    def test_invalid_operation_power(self, client: TestClient) -> None:
         """Test that power operation (not allowed) returns 422."""
         response = client.post(
             "/calculate",
@@ -202,7 +197,7 @@ class TestErrorHandling:
         )
         assert response.status_code == 422
 
-    def test_empty_operation_string_returns_422(self) -> None:
+    def test_empty_operation_string_returns_422(self, client: TestClient) -> None:
         """Test that empty operation string returns 422."""
         response = client.post(
             "/calculate",
@@ -214,7 +209,7 @@ class TestErrorHandling:
 class TestEdgeCases:
     """Tests for edge cases and special scenarios."""
 
-    def test_very_large_numbers(self) -> None:
+    def test_very_large_numbers(self, client: TestClient) -> None:
         """Test operations with very large numbers."""
         response = client.post(
             "/calculate",
@@ -223,7 +218,7 @@ class TestEdgeCases:
         assert response.status_code == 200
         assert response.json() == {"result": 3e10}
 
-    def test_very_small_numbers(self) -> None:
+    def test_very_small_numbers(self, client: TestClient) -> None:
         """Test operations with very small numbers."""
         response = client.post(
             "/calculate",
@@ -233,7 +228,7 @@ class TestEdgeCases:
         result = response.json()["result"]
         assert abs(result - 3e-10) < 1e-15
 
-    def test_float_precision_addition(self) -> None:
+    def test_float_precision_addition(self, client: TestClient) -> None:
         """Test floating point precision in addition (0.1 + 0.2)."""
         response = client.post(
             "/calculate",
@@ -244,7 +239,7 @@ class TestEdgeCases:
         # Use approximate equality for floating point
         assert abs(result - 0.3) < 1e-9
 
-    def test_subtract_same_numbers_equals_zero(self) -> None:
+    def test_subtract_same_numbers_equals_zero(self, client: TestClient) -> None:
         """Test that subtracting identical numbers equals zero."""
         response = client.post(
             "/calculate",
@@ -253,7 +248,7 @@ class TestEdgeCases:
         assert response.status_code == 200
         assert response.json() == {"result": 0.0}
 
-    def test_multiply_by_one(self) -> None:
+    def test_multiply_by_one(self, client: TestClient) -> None:
         """Test multiplying by one (identity element)."""
         response = client.post(
             "/calculate",
@@ -262,7 +257,7 @@ class TestEdgeCases:
         assert response.status_code == 200
         assert response.json() == {"result": 999.0}
 
-    def test_negative_zero_handling(self) -> None:
+    def test_negative_zero_handling(self, client: TestClient) -> None:
         """Test handling of negative zero."""
         response = client.post(
             "/calculate",
@@ -271,7 +266,7 @@ class TestEdgeCases:
         assert response.status_code == 200
         assert response.json() == {"result": 0.0}
 
-    def test_integer_inputs_return_float_output(self) -> None:
+    def test_integer_inputs_return_float_output(self, client: TestClient) -> None:
         """Test that integer inputs return float outputs."""
         response = client.post(
             "/calculate",
@@ -1,17 +1,34 @@
 """
 tests/conftest.py
 ─────────────────
-Shared pytest fixtures for the Instagram-like API test suite.
+Shared pytest fixtures for the Instagram-like API test suite: app clients,
+HTTP and direct-to-storage seeding helpers, and storage snapshots.
 """
 
+import copy
+import uuid
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
-from app.main import app
+from app import models
+from app.main import get_app
+from src.url_shortener import main as shortener_main
 
 
 @pytest.fixture(scope="session")
-def client() -> TestClient:
+def app():
+    """Return the FastAPI application under test.
+
+    Test modules should request this (or ``client``) rather than importing
+    ``app.main`` themselves, so every client shares the one app instance.
+    """
+    return get_app()
+
+
+@pytest.fixture(scope="session")
+def client(app) -> TestClient:
     """Return a synchronous TestClient wrapping the FastAPI app.
 
     Scoped to the session so the app is only instantiated once per test run.
@@ -22,32 +39,206 @@ def client() -> TestClient:
         yield c
 
 
+@pytest.fixture(scope="session")
+def shortener_app():
+    """Return the URL shortener application under test."""
+    return shortener_main.app
+
+
+@pytest.fixture(scope="session")
+def shortener_client(shortener_app) -> TestClient:
+    """Return a TestClient for the URL shortener app, shared by the session.
+
+    Redirects are not followed so tests can assert on the 301 itself. Test
+    modules for the shortener alias this as their ``client``.
+    """
+    with TestClient(shortener_app, follow_redirects=False) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def create_user(client):
+    """Return a helper that registers a user via ``POST /users``.
+
+    The helper returns the response body and asserts the 201; email and
+    display name default to values derived from *username*.
+    """
+
+    def _create_user(username: str, email: str = None, display_name: str = None) -> dict:
+        response = client.post(
+            "/users",
+            json={
+                "username": username,
+                "email": email or f"{username}@example.com",
+                "password": "password123",
+                "display_name": display_name or username.title(),
+            },
+        )
+        assert response.status_code == 201
+        return response.json()
+
+    return _create_user
+
+
+@pytest.fixture(scope="session")
+def create_post(client):
+    """Return a helper that creates an image post via ``POST /posts``."""
+
+    def _create_post(user_id: str, caption: str = None) -> dict:
+        response = client.post(
+            "/posts",
+            json={
+                "user_id": user_id,
+                "media_url": "https://example.com/image.jpg",
+                "media_type": "image",
+                "caption": caption or "Test post",
+            },
+        )
+        assert response.status_code == 201
+        return response.json()
+
+    return _create_post
+
+
+@pytest.fixture(scope="session")
+def seed_user():
+    """Return a helper that inserts a user record straight into ``users_db``.
+
+    Builds the same record as ``POST /users`` (and with the same password as
+    ``create_user``) without going through routing, validation or hashing
+    per request.
+    """
+
+    def _seed_user(username: str, email: str = None, display_name: str = None) -> dict:
+        user_id = str(uuid.uuid4())
+        user = {
+            "id": user_id,
+            "username": username,
+            "email": email or f"{username}@example.com",
+            "password_hash": models.hash_password("password123"),
+            "display_name": display_name or username.title(),
+            "bio": None,
+            "created_at": models.now_utc(),
+        }
+        models.users_db[user_id] = user
+        return user
+
+    return _seed_user
+
+
+@pytest.fixture(scope="session")
+def seed_users(seed_user):
+    """Return a helper that seeds one user per username, returned in order."""
+
+    def _seed_users(*usernames: str) -> list:
+        return [seed_user(username) for username in usernames]
+
+    return _seed_users
+
+
+@pytest.fixture(scope="session")
+def seed_post():
+    """Return a helper that inserts an image post straight into ``posts_db``."""
+
+    def _seed_post(user_id: str, caption: str = "Test post") -> dict:
+        post_id = str(uuid.uuid4())
+        post = {
+            "id": post_id,
+            "user_id": user_id,
+            "media_url": "https://example.com/image.jpg",
+            "media_type": "image",
+            "caption": caption,
+            "created_at": models.now_utc(),
+            "like_count": 0,
+            "share_count": 0,
+        }
+        models.posts_db[post_id] = post
+        return post
+
+    return _seed_post
+
+
+@pytest.fixture(scope="session")
+def seed_share():
+    """Return a helper that records a share of a post, bumping its share_count."""
+
+    def _seed_share(post_id: str, user_id: str) -> dict:
+        share_id = str(uuid.uuid4())
+        share = {
+            "id": share_id,
+            "user_id": user_id,
+            "original_post_id": post_id,
+            "created_at": models.now_utc(),
+        }
+        models.shares_db[share_id] = share
+        models.post_shares[post_id].append(share_id)
+        models.posts_db[post_id]["share_count"] = len(models.post_shares[post_id])
+        return share
+
+    return _seed_share
+
+
+@pytest.fixture(scope="session")
+def snapshot_storage():
+    """Return a helper that deep-copies ``users_db`` and ``posts_db``.
+
+    Lets a test module seed its users and posts once, then start every test
+    from that state via ``restore_storage``.
+    """
+
+    def _snapshot_storage() -> dict:
+        return {
+            "users_db": copy.deepcopy(models.users_db),
+            "posts_db": copy.deepcopy(models.posts_db),
+        }
+
+    return _snapshot_storage
+
+
+@pytest.fixture(scope="session")
+def restore_storage():
+    """Return a helper that clears every store, then reloads a snapshot.
+
+    The records are copied again on the way in: posts carry mutable counts,
+    so each test must get its own.
+    """
+
+    def _restore_storage(snapshot: dict) -> None:
+        models.reset_storage()
+        models.users_db.update(copy.deepcopy(snapshot["users_db"]))
+        models.posts_db.update(copy.deepcopy(snapshot["posts_db"]))
+
+    return _restore_storage
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Run ``@pytest.mark.anyio`` tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture
+async def aclient(app):
+    """Return an async httpx client driving the app in-process.
+
+    For tests that fan out independent requests with ``asyncio.gather``.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
 @pytest.fixture(autouse=False)
 def reset_stores():
     """Optional fixture: clears all in-memory data stores before a test.
 
     Mark a test with ``@pytest.mark.usefixtures('reset_stores')`` or
     declare it as a parameter to get a clean slate.
+
+    There is no teardown reset: every fixture that touches the stores
+    resets them on the way in, so a second pass after each test would only
+    repeat work the next test does anyway.
     """
-    import app.models as m
-
-    m.users_db.clear()
-    m.posts_db.clear()
-    m.follows.clear()
-    m.followers.clear()
-    m.likes.clear()
-    m.shares_db.clear()
-    m.post_shares.clear()
-    m.blocks.clear()
-
-    yield
-
-    # Teardown — clear again after test so later tests aren't polluted.
-    m.users_db.clear()
-    m.posts_db.clear()
-    m.follows.clear()
-    m.followers.clear()
-    m.likes.clear()
-    m.shares_db.clear()
-    m.post_shares.clear()
-    m.blocks.clear()
+    from app.models import reset_storage
+
+    reset_storage()
@@ -10,130 +10,134 @@ from src.datetime_utils import format_duration, parse_date, days_until, business
 class TestFormatDuration:
     """Tests for format_duration function."""
 
-    def test_zero_seconds(self):
-        """Test formatting 0 seconds."""
-        assert format_duration(0) == "0s"
-
-    def test_only_seconds(self):
-        """Test formatting seconds only."""
-        assert format_duration(45) == "45s"
-
-    def test_minutes_and_seconds(self):
-        """Test formatting minutes and seconds."""
-        assert format_duration(150) == "2m 30s"
-
-    def test_hours_minutes_seconds(self):
-        """Test formatting hours, minutes, and seconds."""
-        assert format_duration(9015) == "2h 30m 15s"
-
-    def test_days_with_zeros(self):
-        """Test formatting with days shows all lower units."""
-        assert format_duration(86400) == "1d 0h 0m 0s"
-
-    def test_days_all_nonzero(self):
-        """Test formatting days with all non-zero components."""
-        assert format_duration(90061) == "1d 1h 1m 1s"
-
-    def test_hours_only(self):
-        """Test formatting with only hours set."""
-        assert format_duration(3600) == "1h 0m 0s"
+    @pytest.mark.parametrize(
+        "seconds, expected",
+        [
+            (0, "0s"),
+            (1, "1s"),
+            (45, "45s"),
+            (150, "2m 30s"),
+            (3600, "1h 0m 0s"),
+            (9015, "2h 30m 15s"),
+            (86400, "1d 0h 0m 0s"),
+            (90061, "1d 1h 1m 1s"),
+            # 3 days + 5 hours + 20 minutes + 30 seconds
+            (3 * 86400 + 5 * 3600 + 20 * 60 + 30, "3d 5h 20m 30s"),
+        ],
+        ids=[
+            "zero", "one_second", "only_seconds", "minutes_and_seconds",
+            "hours_only", "hours_minutes_seconds", "days_with_zeros",
+            "days_all_nonzero", "large_duration",
+        ],
+    )
+    def test_format(self, seconds, expected):
+        """Test formatting shows every unit below the highest one present."""
+        assert format_duration(seconds) == expected
 
     def test_negative_seconds_raises_error(self):
         """Test that negative seconds raises ValueError."""
         with pytest.raises(ValueError):
             format_duration(-1)
 
-    def test_large_duration(self):
-        """Test formatting a large duration."""
-        # 3 days + 5 hours + 20 minutes + 30 seconds
-        seconds = 3 * 86400 + 5 * 3600 + 20 * 60 + 30
-        assert format_duration(seconds) == "3d 5h 20m 30s"
-
-    def test_one_second(self):
-        """Test formatting 1 second."""
-        assert format_duration(1) == "1s"
-
 
 class TestParseDate:
     """Tests for parse_date function."""
 
-    def test_iso_8601_date_only(self):
-        """Test parsing ISO 8601 date format."""
-        result = parse_date("2025-01-15")
-        assert result == datetime(2025, 1, 15, 0, 0)
-
-    def test_iso_8601_with_time(self):
-        """Test parsing ISO 8601 with time."""
-        result = parse_date("2025-01-15T10:30:00")
-        assert result == datetime(2025, 1, 15, 10, 30, 0)
-
-    def test_abbreviated_month(self):
-        """Test parsing abbreviated month format."""
-        result = parse_date("Jan 15 2025")
-        assert result == datetime(2025, 1, 15, 0, 0)
-
-    def test_full_month_with_comma(self):
-        """Test parsing full month with comma."""
-        result = parse_date("January 15, 2025")
-        assert result == datetime(2025, 1, 15, 0, 0)
-
-    def test_european_date_format(self):
-        """Test parsing DD/MM/YYYY format."""
-        result = parse_date("15/01/2025")
-        assert result == datetime(2025, 1, 15, 0, 0)
-
-    def test_unparseable_string_raises_error(self):
-        """Test that unparseable string raises ValueError."""
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("2025-01-15", datetime(2025, 1, 15, 0, 0)),
+            ("2025-01-15T10:30:00", datetime(2025, 1, 15, 10, 30, 0)),
+            ("Jan 15 2025", datetime(2025, 1, 15, 0, 0)),
+            ("January 15, 2025", datetime(2025, 1, 15, 0, 0)),
+            ("15/01/2025", datetime(2025, 1, 15, 0, 0)),
+            ("Feb 28 2025", datetime(2025, 2, 28)),
+            ("December 25, 2025", datetime(2025, 12, 25)),
+        ],
+        ids=[
+            "iso_8601_date_only", "iso_8601_with_time", "abbreviated_month",
+            "full_month_with_comma", "european_date_format",
+            "abbreviated_february", "full_december",
+        ],
+    )
+    def test_parse(self, text, expected):
+        """Test parsing every supported format."""
+        assert parse_date(text) == expected
+
+    @pytest.mark.parametrize(
+        "text",
+        ["not a date", "2025-13-45"],  # second: invalid month and day
+        ids=["unparseable_string", "invalid_date"],
+    )
+    def test_invalid_input_raises_error(self, text):
+        """Test that unparseable or impossible dates raise ValueError."""
         with pytest.raises(ValueError, match="Unable to parse date"):
-            parse_date("not a date")
+            parse_date(text)
+
+    def test_repeated_input_is_served_from_cache(self):
+        """Test that parsing the same string twice hits the memo cache."""
+        parse_date.cache_clear()
+        first = parse_date("2025-03-01")
+        hits = parse_date.cache_info().hits
+        assert parse_date("2025-03-01") is first
+        assert parse_date.cache_info().hits == hits + 1
 
-    def test_invalid_date_raises_error(self):
-        """Test that invalid date raises ValueError."""
-        with pytest.raises(ValueError, match="Unable to parse date"):
-            parse_date("2025-13-45")  # Invalid month and day
 
-    def test_multiple_months(self):
-        """Test parsing different months."""
-        assert parse_date("Feb 28 2025") == datetime(2025, 2, 28)
-        assert parse_date("December 25, 2025") == datetime(2025, 12, 25)
+@pytest.fixture(scope="module")
+def today() -> date:
+    """Return the current date, read once for the whole module."""
+    return date.today()
 
 
 class TestDaysUntil:
     """Tests for days_until function."""
 
-    def test_today_returns_zero(self):
+    @pytest.fixture(autouse=True)
+    def _pin_today(self, monkeypatch, today):
+        """Pin days_until's notion of today so no test can straddle midnight."""
+        monkeypatch.setattr("src.datetime_utils.datetime_utils._today", lambda: today)
+
+    def test_today_returns_zero(self, today):
         """Test that today returns 0."""
-        assert days_until(date.today()) == 0
+        assert days_until(today) == 0
 
-    def test_future_date(self):
+    def test_future_date(self, today):
         """Test that future date returns positive integer."""
-        future = date.today() + timedelta(days=5)
+        future = today + timedelta(days=5)
         assert days_until(future) == 5
 
-    def test_past_date(self):
+    def test_past_date(self, today):
         """Test that past date returns negative integer."""
-        past = date.today() - timedelta(days=5)
+        past = today - timedelta(days=5)
         assert days_until(past) == -5
 
-    def test_tomorrow(self):
+    def test_tomorrow(self, today):
         """Test tomorrow is 1 day away."""
-        tomorrow = date.today() + timedelta(days=1)
+        tomorrow = today + timedelta(days=1)
         assert days_until(tomorrow) == 1
 
-    def test_yesterday(self):
+    def test_yesterday(self, today):
         """Test yesterday is -1 days away."""
-        yesterday = date.today() - timedelta(days=1)
+        yesterday = today - timedelta(days=1)
         assert days_until(yesterday) == -1
 
-    def test_one_year_ahead(self):
+    def test_one_year_ahead(self, today):
         """Test calculating days to same date next year."""
-        today = date.today()
         next_year = date(today.year + 1, today.month, today.day)
         days_diff = days_until(next_year)
         # Should be approximately 365 or 366 days
         assert days_diff in [365, 366]
 
 
+class TestDaysUntilUnpinned:
+    """days_until against the real clock, with _today left unpatched."""
+
+    def test_reads_the_current_date(self):
+        """Test that an unpinned call counts from the real current date."""
+        # Either side of a midnight rollover between the two date.today() calls.
+        assert days_until(date.today() + timedelta(days=30)) in [29, 30]
+
+
 class TestBusinessDaysBetween:
     """Tests for business_days_between function."""
 
@@ -182,3 +186,8 @@ class TestBusinessDaysBetween:
         """Test Friday to next Monday (includes weekend)."""
         # 2025-01-10 is Friday, 2025-01-13 is Monday
         assert business_days_between(date(2025, 1, 10), date(2025, 1, 13)) == 2
+
+    def test_full_year(self):
+        """Test a full calendar year is computed without day-by-day drift."""
+        # 2025 starts on a Wednesday: 52 full weeks + 1 extra weekday
+        assert business_days_between(date(2025, 1, 1), date(2025, 12, 31)) == 261
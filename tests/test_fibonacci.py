@@ -10,59 +10,20 @@ from src.fibonacci.fibonacci import fibonacci
 
 
 # ---------------------------------------------------------------------------
-# Base Cases
+# Known Values
 # ---------------------------------------------------------------------------
 
-class TestBaseCases:
-    """Tests for base cases of the Fibonacci sequence."""
+class TestKnownValues:
+    """Tests for base cases, small values and larger values of the sequence."""
 
-    def test_fibonacci_zero(self) -> None:
-        """Test F(0) = 0."""
-        assert fibonacci(0) == 0
-
-    def test_fibonacci_one(self) -> None:
-        """Test F(1) = 1."""
-        assert fibonacci(1) == 1
-
-
-# ---------------------------------------------------------------------------
-# Small Values
-# ---------------------------------------------------------------------------
-
-class TestSmallValues:
-    """Tests for small Fibonacci values."""
-
-    def test_fibonacci_two(self) -> None:
-        """Test F(2) = 1."""
-        assert fibonacci(2) == 1
-
-    def test_fibonacci_three(self) -> None:
-        """Test F(3) = 2."""
-        assert fibonacci(3) == 2
-
-    def test_fibonacci_five(self) -> None:
-        """Test F(5) = 5."""
-        assert fibonacci(5) == 5
-
-
-# ---------------------------------------------------------------------------
-# Larger Values
-# ---------------------------------------------------------------------------
-
-class TestLargerValues:
-    """Tests for larger Fibonacci values."""
-
-    def test_fibonacci_ten(self) -> None:
-        """Test F(10) = 55."""
-        assert fibonacci(10) == 55
-
-    def test_fibonacci_twenty(self) -> None:
-        """Test F(20) = 6765."""
-        assert fibonacci(20) == 6765
-
-    def test_fibonacci_thirty(self) -> None:
-        """Test F(30) = 832040."""
-        assert fibonacci(30) == 832040
+    @pytest.mark.parametrize(
+        "n, expected",
+        [(0, 0), (1, 1), (2, 1), (3, 2), (5, 5), (10, 55), (20, 6765), (30, 832040)],
+        ids=lambda value: str(value),
+    )
+    def test_fibonacci_known_value(self, n: int, expected: int) -> None:
+        """Test F(n) matches the known value."""
+        assert fibonacci(n) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -114,3 +75,41 @@ class TestNonIntegerInputError:
         """Test that fibonacci([5]) raises TypeError."""
         with pytest.raises(TypeError, match="must be an integer"):
             fibonacci([5])
+
+
+# ---------------------------------------------------------------------------
+# Very Large Values
+# ---------------------------------------------------------------------------
+
+class TestVeryLargeValues:
+    """Tests for indices far beyond what an O(n) loop handles quickly."""
+
+    def test_fibonacci_hundred(self) -> None:
+        """Test F(100) = 354224848179261915075."""
+        assert fibonacci(100) == 354224848179261915075
+
+    def test_fibonacci_table_boundary(self) -> None:
+        """Test the last tabulated index and the first computed one agree with the recurrence."""
+        assert fibonacci(92) == 7540113804746346429
+        assert fibonacci(93) == fibonacci(92) + fibonacci(91)
+
+    def test_fibonacci_consistent_with_recurrence(self) -> None:
+        """Test F(n) = F(n-1) + F(n-2) holds for a large n."""
+        n = 10_000
+        assert fibonacci(n) == fibonacci(n - 1) + fibonacci(n - 2)
+
+
+# ---------------------------------------------------------------------------
+# Integer Subclass Input
+# ---------------------------------------------------------------------------
+
+class TestIntegerSubclassInput:
+    """Tests that int subclasses such as bool are accepted."""
+
+    def test_fibonacci_true_is_one(self) -> None:
+        """Test fibonacci(True) behaves like fibonacci(1)."""
+        assert fibonacci(True) == 1
+
+    def test_fibonacci_false_is_zero(self) -> None:
+        """Test fibonacci(False) behaves like fibonacci(0)."""
+        assert fibonacci(False) == 0
@@ -2,158 +2,138 @@
 
 Tests follow/unfollow functionality, follower/following lists, and block enforcement.
 
-Uses FastAPI's TestClient with in-memory data stores that are reset before each test.
+Uses the session-scoped TestClient from conftest.  The test users are
+registered once per module; every other in-memory store is reset before
+each test.
 """
 
+from types import SimpleNamespace
+
 import pytest
 from fastapi.testclient import TestClient
 
-from app.main import app
-from app.models import (
-    users_db,
-    posts_db,
-    follows,
-    followers,
-    likes,
-    shares_db,
-    post_shares,
-    blocks,
-)
+from app.models import blocks, followers, follows, reset_storage
 
 
-@pytest.fixture(autouse=True)
-def clear_db():
-    """Reset all in-memory storage before each test."""
-    users_db.clear()
-    posts_db.clear()
-    follows.clear()
-    followers.clear()
-    likes.clear()
-    shares_db.clear()
-    post_shares.clear()
-    blocks.clear()
-    yield
+# Accepted status codes for create-style and delete-style calls.
+_OK_CREATE = frozenset({200, 201})
+_OK_DELETE = frozenset({200, 204})
 
 
-@pytest.fixture
-def client() -> TestClient:
-    """Return a TestClient for the app."""
-    return TestClient(app)
-
-
-def create_user(client: TestClient, username: str, email: str = None, display_name: str = None):
-    """Helper to create a user and return the user dict."""
-    if email is None:
-        email = f"{username}@example.com"
-    if display_name is None:
-        display_name = username.title()
-    
-    response = client.post(
-        "/users",
-        json={
-            "username": username,
-            "email": email,
-            "password": "password123",
-            "display_name": display_name,
-        },
-    )
-    assert response.status_code == 201
-    return response.json()
+@pytest.fixture(scope="module")
+def users(create_user):
+    """Register alice, bob and charlie once per module and return them by name.
+
+    The users themselves never change across these tests, only the
+    relationships between them, so clear_db restores users_db from a
+    snapshot instead of re-registering everyone for every test.
+    """
+    reset_storage()
+    created = {name: create_user(name) for name in ("alice", "bob", "charlie")}
+    yield created
+    reset_storage()
+
+
+@pytest.fixture(scope="module")
+def paths(users) -> dict:
+    """Per-user endpoint paths, formatted once per module rather than per call."""
+    return {
+        name: SimpleNamespace(
+            follow=f"/users/{user['id']}/follow",
+            followers=f"/users/{user['id']}/followers",
+            following=f"/users/{user['id']}/following",
+        )
+        for name, user in users.items()
+    }
+
+
+@pytest.fixture(scope="module")
+def users_snapshot(users, snapshot_storage):
+    """Storage snapshot taken right after the module's users were created."""
+    return snapshot_storage()
+
+
+@pytest.fixture(autouse=True)
+def clear_db(users_snapshot, restore_storage):
+    """Start each test from the module's users with no relationships."""
+    restore_storage(users_snapshot)
+    yield
 
 
 class TestFollowUser:
     """Tests for following a user."""
 
-    def test_follow_user_returns_200_or_201(self, client: TestClient):
+    def test_follow_user_returns_200_or_201(self, client: TestClient, users, paths):
         """Following a user should return 200 or 201."""
-        alice = create_user(client, "alice")
-        bob = create_user(client, "bob")
+        alice = users["alice"]
         
         response = client.post(
-            f"/users/{bob['id']}/follow",
+            paths["bob"].follow,
             json={"follower_id": alice["id"]},
         )
-        assert response.status_code in [200, 201]
+        assert response.status_code in _OK_CREATE
 
-    def test_follow_user_adds_relationship(self, client: TestClient):
+    def test_follow_user_adds_relationship(self, client: TestClient, users, paths):
         """Following a user should create a follow relationship."""
-        alice = create_user(client, "alice")
-        bob = create_user(client, "bob")
+        alice = users["alice"]
+        bob = users["bob"]
         
         response = client.post(
-            f"/users/{bob['id']}/follow",
+            paths["bob"].follow,
             json={"follower_id": alice["id"]},
         )
-        assert response.status_code in [200, 201]
+        assert response.status_code in _OK_CREATE
         
         # Verify relationship exists
-        assert bob["id"] in follows.get(alice["id"], set())
+        assert bob["id"] in follows[alice["id"]]
 
-    def test_follow_self_returns_400(self, client: TestClient):
-        """Attempting to follow oneself should return 400."""
-        alice = create_user(client, "alice")
-        
-        response = client.post(
-            f"/users/{alice['id']}/follow",
-            json={"follower_id": alice["id"]},
-        )
-        assert response.status_code == 400
-
-    def test_follow_already_followed_user_returns_400(self, client: TestClient):
+    def test_follow_already_followed_user_returns_400(self, client: TestClient, users, paths):
         """Following a user twice should return 400."""
-        alice = create_user(client, "alice")
-        bob = create_user(client, "bob")
+        alice = users["alice"]
         
         # First follow
         response1 = client.post(
-            f"/users/{bob['id']}/follow",
+            paths["bob"].follow,
             json={"follower_id": alice["id"]},
         )
-        assert response1.status_code in [200, 201]
+        assert response1.status_code in _OK_CREATE
         
         # Second follow (should fail)
         response2 = client.post(
-            f"/users/{bob['id']}/follow",
+            paths["bob"].follow,
             json={"follower_id": alice["id"]},
         )
         assert response2.status_code == 400
 
-    def test_follow_nonexistent_user_returns_404(self, client: TestClient):
-        """Following a non-existent user should return 404."""
-        alice = create_user(client, "alice")
-        fake_id = "nonexistent-user-id"
-        
-        response = client.post(
-            f"/users/{fake_id}/follow",
-            json={"follower_id": alice["id"]},
-        )
-        assert response.status_code == 404
+    @pytest.mark.parametrize(
+        "target, follower, expected_status",
+        [
+            ("alice", "alice", 400),
+            ("missing", "alice", 404),
+            ("alice", "missing", 404),
+        ],
+        ids=["self", "nonexistent_target", "nonexistent_follower"],
+    )
+    def test_follow_rejected(self, client: TestClient, users, target, follower, expected_status):
+        """Following oneself is a 400; an unknown target or follower is a 404."""
+        ids = {"alice": users["alice"]["id"], "missing": "nonexistent-user-id"}
 
-    def test_follow_by_nonexistent_follower_returns_404(self, client: TestClient):
-        """Following as a non-existent user should return 404."""
-        bob = create_user(client, "bob")
-        fake_id = "nonexistent-user-id"
-        
         response = client.post(
-            f"/users/{bob['id']}/follow",
-            json={"follower_id": fake_id},
+            f"/users/{ids[target]}/follow",
+            json={"follower_id": ids[follower]},
         )
-        assert response.status_code == 404
+        assert response.status_code == expected_status
 
-    def test_follow_when_blocked_returns_403(self, client: TestClient):
+    def test_follow_when_blocked_returns_403(self, client: TestClient, users, paths):
         """Following a user who has blocked you should return 403."""
-        alice = create_user(client, "alice")
-        bob = create_user(client, "bob")
+        alice = users["alice"]
         
-        # Bob blocks Alice via the API
-        client.post(
-            f"/users/{bob['id']}/block",
-            json={"blocked_user_id": alice["id"]},
-        )
+        # Bob blocks Alice (set directly; the block endpoint has its own tests)
+        blocks[users["bob"]["id"]].add(alice["id"])
 
         # Alice tries to follow Bob (but Bob has blocked Alice)
         response = client.post(
-            f"/users/{bob['id']}/follow",
+            paths["bob"].follow,
             json={"follower_id": alice["id"]},
         )
         assert response.status_code == 403
@@ -162,45 +142,43 @@ class TestFollowUser:
 class TestUnfollowUser:
     """Tests for unfollowing a user."""
 
-    def test_unfollow_returns_200_or_204(self, client: TestClient):
+    def test_unfollow_returns_200_or_204(self, client: TestClient, users, paths):
         """Unfollowing a user should return 200 or 204."""
-        alice = create_user(client, "alice")
-        bob = create_user(client, "bob")
+        alice = users["alice"]
         
         # Follow first
         client.post(
-            f"/users/{bob['id']}/follow",
+            paths["bob"].follow,
             json={"follower_id": alice["id"]},
         )
         
         # Then unfollow
-        response = client.request("DELETE", f"/users/{bob['id']}/follow", json={"follower_id": alice["id"]},
+        response = client.request("DELETE", paths["bob"].follow, json={"follower_id": alice["id"]},
         )
-        assert response.status_code in [200, 204]
+        assert response.status_code in _OK_DELETE
 
-    def test_unfollow_removes_relationship(self, client: TestClient):
+    def test_unfollow_removes_relationship(self, client: TestClient, users, paths):
         """Unfollowing should remove the follow relationship."""
-        alice = create_user(client, "alice")
-        bob = create_user(client, "bob")
+        alice = users["alice"]
+        bob = users["bob"]
 
         # Follow
         client.post(
-            f"/users/{bob['id']}/follow",
+            paths["bob"].follow,
             json={"follower_id": alice["id"]},
         )
-        assert bob["id"] in follows.get(alice["id"], set())
+        assert bob["id"] in follows[alice["id"]]
 
         # Unfollow
-        client.request("DELETE", f"/users/{bob['id']}/follow", json={"follower_id": alice["id"]},
+        client.request("DELETE", paths["bob"].follow, json={"follower_id": alice["id"]},
         )
-        assert bob["id"] not in follows.get(alice["id"], set())
+        assert bob["id"] not in follows[alice["id"]]
 
-    def test_unfollow_when_not_following_returns_400(self, client: TestClient):
+    def test_unfollow_when_not_following_returns_400(self, client: TestClient, users, paths):
         """Unfollowing a user you're not following should return 400."""
-        alice = create_user(client, "alice")
-        bob = create_user(client, "bob")
+        alice = users["alice"]
         
-        response = client.request("DELETE", f"/users/{bob['id']}/follow", json={"follower_id": alice["id"]},
+        response = client.request("DELETE", paths["bob"].follow, json={"follower_id": alice["id"]},
         )
         assert response.status_code == 400
 
@@ -208,39 +186,44 @@ class TestUnfollowUser:
 class TestGetFollowers:
     """Tests for retrieving followers list."""
 
-    def test_get_followers_returns_correct_users(self, client: TestClient):
+    def test_get_followers_returns_correct_users(self, client: TestClient, users, paths):
         """Getting followers should return the correct list of users."""
-        alice = create_user(client, "alice")
-        bob = create_user(client, "bob")
-        charlie = create_user(client, "charlie")
+        alice = users["alice"]
+        charlie = users["charlie"]
         
         # Alice and Charlie follow Bob
         client.post(
-            f"/users/{bob['id']}/follow",
+            paths["bob"].follow,
             json={"follower_id": alice["id"]},
         )
         client.post(
-            f"/users/{bob['id']}/follow",
+            paths["bob"].follow,
             json={"follower_id": charlie["id"]},
         )
         
-        response = client.get(f"/users/{bob['id']}/followers")
+        response = client.get(paths["bob"].followers)
         assert response.status_code == 200
         followers_list = response.json()
         
         # Should contain Alice and Charlie
-        follower_ids = [f["id"] for f in followers_list]
-        assert alice["id"] in follower_ids
-        assert charlie["id"] in follower_ids
+        follower_ids = {f["id"] for f in followers_list}
+        assert {alice["id"], charlie["id"]} <= follower_ids
 
-    def test_get_followers_empty_list(self, client: TestClient):
+    def test_get_followers_empty_list(self, client: TestClient, users, paths):
         """Getting followers for a user with no followers should return empty list."""
-        alice = create_user(client, "alice")
         
-        response = client.get(f"/users/{alice['id']}/followers")
+        response = client.get(paths["alice"].followers)
         assert response.status_code == 200
         assert response.json() == []
 
+    def test_reads_do_not_grow_relationship_stores(self, client: TestClient, users, paths):
+        """Read-only endpoints must not insert empty entries into the stores."""
+        client.get(paths["alice"].followers)
+        client.get(paths["alice"].following)
+        client.get(f"/users/{users['alice']['id']}")
+        assert not follows
+        assert not followers
+
     def test_get_followers_nonexistent_user_returns_404(self, client: TestClient):
         """Getting followers for non-existent user should return 404."""
         fake_id = "nonexistent-user-id"
@@ -252,36 +235,34 @@ class TestGetFollowers:
 class TestGetFollowing:
     """Tests for retrieving following list."""
 
-    def test_get_following_returns_correct_users(self, client: TestClient):
+    def test_get_following_returns_correct_users(self, client: TestClient, users, paths):
         """Getting following should return the correct list of users."""
-        alice = create_user(client, "alice")
-        bob = create_user(client, "bob")
-        charlie = create_user(client, "charlie")
+        alice = users["alice"]
+        bob = users["bob"]
+        charlie = users["charlie"]
         
         # Alice follows Bob and Charlie
         client.post(
-            f"/users/{bob['id']}/follow",
+            paths["bob"].follow,
             json={"follower_id": alice["id"]},
         )
         client.post(
-            f"/users/{charlie['id']}/follow",
+            paths["charlie"].follow,
             json={"follower_id": alice["id"]},
         )
         
-        response = client.get(f"/users/{alice['id']}/following")
+        response = client.get(paths["alice"].following)
         assert response.status_code == 200
         following_list = response.json()
         
         # Should contain Bob and Charlie
-        following_ids = [f["id"] for f in following_list]
-        assert bob["id"] in following_ids
-        assert charlie["id"] in following_ids
+        following_ids = {f["id"] for f in following_list}
+        assert {bob["id"], charlie["id"]} <= following_ids
 
-    def test_get_following_empty_list(self, client: TestClient):
+    def test_get_following_empty_list(self, client: TestClient, users, paths):
         """Getting following for a user who follows no one should return empty list."""
-        alice = create_user(client, "alice")
         
-        response = client.get(f"/users/{alice['id']}/following")
+        response = client.get(paths["alice"].following)
         assert response.status_code == 200
         assert response.json() == []
 
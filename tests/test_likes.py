@@ -2,166 +2,137 @@
 
 Tests liking/unliking posts, like counts, and block enforcement.
 
-Uses FastAPI's TestClient with in-memory data stores that are reset before each test.
+Uses the session-scoped TestClient from conftest.  A baseline of three users
+and one post is registered once per module; every test starts from that
+baseline with no likes.
 """
 
+import asyncio
+from types import SimpleNamespace
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
-from app.main import app
-from app.models import (
-    users_db,
-    posts_db,
-    follows,
-    followers,
-    likes,
-    shares_db,
-    post_shares,
-    blocks,
-)
+from app.models import blocks, likes, reset_storage
+
+
+# Accepted status codes for create-style and delete-style calls.
+_OK_CREATE = frozenset({200, 201})
+_OK_DELETE = frozenset({200, 204})
+
+
+@pytest.fixture(scope="module")
+def baseline(create_user, create_post) -> SimpleNamespace:
+    """Register alice, bob and charlie and one post by alice, once per module.
+
+    Only likes change between tests, so clear_db re-seeds users_db/posts_db
+    from a snapshot of this state instead of re-POSTing it for every test.
+    """
+    reset_storage()
+    alice = create_user("alice")
+    post = create_post(alice["id"])
+    bob = create_user("bob")
+    charlie = create_user("charlie")
+    yield SimpleNamespace(
+        alice=alice,
+        post=post,
+        bob=bob,
+        charlie=charlie,
+        # Paths formatted once here rather than at every call site.
+        like_url=f"/posts/{post['id']}/like",
+        likes_url=f"/posts/{post['id']}/likes",
+    )
+    reset_storage()
+
+
+@pytest.fixture(scope="module")
+def baseline_snapshot(baseline: SimpleNamespace, snapshot_storage) -> dict:
+    """Storage snapshot taken right after the baseline was created."""
+    return snapshot_storage()
 
 
 @pytest.fixture(autouse=True)
-def clear_db():
-    """Reset all in-memory storage before each test."""
-    users_db.clear()
-    posts_db.clear()
-    follows.clear()
-    followers.clear()
-    likes.clear()
-    shares_db.clear()
-    post_shares.clear()
-    blocks.clear()
-    yield
-
-
-@pytest.fixture
-def client() -> TestClient:
-    """Return a TestClient for the app."""
-    return TestClient(app)
-
-
-def create_user(client: TestClient, username: str, email: str = None, display_name: str = None):
-    """Helper to create a user and return the user dict."""
-    if email is None:
-        email = f"{username}@example.com"
-    if display_name is None:
-        display_name = username.title()
-    
-    response = client.post(
-        "/users",
-        json={
-            "username": username,
-            "email": email,
-            "password": "password123",
-            "display_name": display_name,
-        },
-    )
-    assert response.status_code == 201
-    return response.json()
-
-
-def create_post(client: TestClient, user_id: str, caption: str = None):
-    """Helper to create a post and return the post dict."""
-    response = client.post(
-        "/posts",
-        json={
-            "user_id": user_id,
-            "media_url": "https://example.com/image.jpg",
-            "media_type": "image",
-            "caption": caption or "Test post",
-        },
-    )
-    assert response.status_code == 201
-    return response.json()
+def clear_db(baseline_snapshot: dict, restore_storage):
+    """Start each test from the module's baseline users and post."""
+    restore_storage(baseline_snapshot)
 
 
 class TestLikePost:
     """Tests for liking a post."""
 
-    def test_like_post_returns_200_or_201(self, client: TestClient):
+    def test_like_post_returns_200_or_201(self, client: TestClient, baseline):
         """Liking a post should return 200 or 201."""
-        alice = create_user(client, "alice")
-        post = create_post(client, alice["id"])
-        bob = create_user(client, "bob")
+        bob = baseline.bob
         
         response = client.post(
-            f"/posts/{post['id']}/like",
+            baseline.like_url,
             json={"user_id": bob["id"]},
         )
-        assert response.status_code in [200, 201]
+        assert response.status_code in _OK_CREATE
 
-    def test_like_post_increments_count(self, client: TestClient):
+    def test_like_post_increments_count(self, client: TestClient, baseline):
         """Liking a post should increment its like count."""
-        alice = create_user(client, "alice")
-        post = create_post(client, alice["id"])
-        bob = create_user(client, "bob")
+        post = baseline.post
+        bob = baseline.bob
         
         # Like the post
         response = client.post(
-            f"/posts/{post['id']}/like",
+            baseline.like_url,
             json={"user_id": bob["id"]},
         )
-        assert response.status_code in [200, 201]
+        assert response.status_code in _OK_CREATE
         
         # Verify like was added
-        assert bob["id"] in likes.get(post["id"], set())
+        assert bob["id"] in likes[post["id"]]
 
-    def test_like_already_liked_post_returns_400(self, client: TestClient):
+    def test_like_already_liked_post_returns_400(self, client: TestClient, baseline):
         """Liking a post twice should return 400."""
-        alice = create_user(client, "alice")
-        post = create_post(client, alice["id"])
-        bob = create_user(client, "bob")
+        bob = baseline.bob
         
         # Like the post
         response1 = client.post(
-            f"/posts/{post['id']}/like",
+            baseline.like_url,
             json={"user_id": bob["id"]},
         )
-        assert response1.status_code in [200, 201]
+        assert response1.status_code in _OK_CREATE
         
         # Like again (should fail)
         response2 = client.post(
-            f"/posts/{post['id']}/like",
+            baseline.like_url,
             json={"user_id": bob["id"]},
         )
         assert response2.status_code == 400
 
-    def test_like_nonexistent_post_returns_404(self, client: TestClient):
-        """Liking a non-existent post should return 404."""
-        bob = create_user(client, "bob")
-        fake_post_id = "nonexistent-post-id"
-        
-        response = client.post(
-            f"/posts/{fake_post_id}/like",
-            json={"user_id": bob["id"]},
-        )
-        assert response.status_code == 404
+    @pytest.mark.parametrize(
+        "missing_post, missing_user",
+        [(True, False), (False, True)],
+        ids=["nonexistent_post", "nonexistent_user"],
+    )
+    def test_like_unknown_post_or_user_returns_404(
+        self, client: TestClient, baseline, missing_post, missing_user
+    ):
+        """Liking a non-existent post, or as a non-existent user, should return 404."""
+        alice = baseline.alice
+        post_id = "nonexistent-post-id" if missing_post else baseline.post["id"]
+        user_id = "nonexistent-user-id" if missing_user else alice["id"]
 
-    def test_like_by_nonexistent_user_returns_404(self, client: TestClient):
-        """Liking as a non-existent user should return 404."""
-        alice = create_user(client, "alice")
-        post = create_post(client, alice["id"])
-        fake_user_id = "nonexistent-user-id"
-        
         response = client.post(
-            f"/posts/{post['id']}/like",
-            json={"user_id": fake_user_id},
+            f"/posts/{post_id}/like",
+            json={"user_id": user_id},
         )
         assert response.status_code == 404
 
-    def test_like_when_blocked_by_post_owner_returns_403(self, client: TestClient):
+    def test_like_when_blocked_by_post_owner_returns_403(self, client: TestClient, baseline):
         """Liking a post when blocked by post owner should return 403."""
-        alice = create_user(client, "alice")
-        post = create_post(client, alice["id"])
-        bob = create_user(client, "bob")
+        bob = baseline.bob
         
-        # Alice blocks Bob via API
-        client.post(f"/users/{alice['id']}/block", json={"blocked_user_id": bob["id"]})
+        # Alice blocks Bob (set directly; the block endpoint has its own tests)
+        blocks[baseline.alice["id"]].add(bob["id"])
 
         # Bob tries to like Alice's post
         response = client.post(
-            f"/posts/{post['id']}/like",
+            baseline.like_url,
             json={"user_id": bob["id"]},
         )
         assert response.status_code == 403
@@ -170,48 +141,43 @@ class TestLikePost:
 class TestUnlikePost:
     """Tests for unliking a post."""
 
-    def test_unlike_returns_200_or_204(self, client: TestClient):
+    def test_unlike_returns_200_or_204(self, client: TestClient, baseline):
         """Unliking a post should return 200 or 204."""
-        alice = create_user(client, "alice")
-        post = create_post(client, alice["id"])
-        bob = create_user(client, "bob")
+        bob = baseline.bob
         
         # Like first
         client.post(
-            f"/posts/{post['id']}/like",
+            baseline.like_url,
             json={"user_id": bob["id"]},
         )
         
         # Then unlike
-        response = client.request("DELETE", f"/posts/{post['id']}/like", json={"user_id": bob["id"]},
+        response = client.request("DELETE", baseline.like_url, json={"user_id": bob["id"]},
         )
-        assert response.status_code in [200, 204]
+        assert response.status_code in _OK_DELETE
 
-    def test_unlike_removes_like(self, client: TestClient):
+    def test_unlike_removes_like(self, client: TestClient, baseline):
         """Unliking a post should remove the like."""
-        alice = create_user(client, "alice")
-        post = create_post(client, alice["id"])
-        bob = create_user(client, "bob")
+        post = baseline.post
+        bob = baseline.bob
         
         # Like
         client.post(
-            f"/posts/{post['id']}/like",
+            baseline.like_url,
             json={"user_id": bob["id"]},
         )
-        assert bob["id"] in likes.get(post["id"], set())
+        assert bob["id"] in likes[post["id"]]
 
         # Unlike
-        client.request("DELETE", f"/posts/{post['id']}/like", json={"user_id": bob["id"]},
+        client.request("DELETE", baseline.like_url, json={"user_id": bob["id"]},
         )
-        assert bob["id"] not in likes.get(post["id"], set())
+        assert bob["id"] not in likes[post["id"]]
 
-    def test_unlike_when_not_liked_returns_400(self, client: TestClient):
+    def test_unlike_when_not_liked_returns_400(self, client: TestClient, baseline):
         """Unliking a post you haven't liked should return 400."""
-        alice = create_user(client, "alice")
-        post = create_post(client, alice["id"])
-        bob = create_user(client, "bob")
+        bob = baseline.bob
         
-        response = client.request("DELETE", f"/posts/{post['id']}/like", json={"user_id": bob["id"]},
+        response = client.request("DELETE", baseline.like_url, json={"user_id": bob["id"]},
         )
         assert response.status_code == 400
 
@@ -219,24 +185,18 @@ class TestUnlikePost:
 class TestGetLikes:
     """Tests for retrieving likes list."""
 
-    def test_get_likes_returns_correct_user_ids(self, client: TestClient):
+    @pytest.mark.anyio
+    async def test_get_likes_returns_correct_user_ids(self, aclient: httpx.AsyncClient, baseline):
         """Getting likes should return the correct list of user IDs."""
-        alice = create_user(client, "alice")
-        post = create_post(client, alice["id"])
-        bob = create_user(client, "bob")
-        charlie = create_user(client, "charlie")
-        
+        bob, charlie = baseline.bob, baseline.charlie
+
         # Bob and Charlie like the post
-        client.post(
-            f"/posts/{post['id']}/like",
-            json={"user_id": bob["id"]},
-        )
-        client.post(
-            f"/posts/{post['id']}/like",
-            json={"user_id": charlie["id"]},
+        await asyncio.gather(
+            aclient.post(baseline.like_url, json={"user_id": bob["id"]}),
+            aclient.post(baseline.like_url, json={"user_id": charlie["id"]}),
         )
-        
-        response = client.get(f"/posts/{post['id']}/likes")
+
+        response = await aclient.get(baseline.likes_url)
         assert response.status_code == 200
         data = response.json()
         
@@ -247,15 +207,12 @@ class TestGetLikes:
         else:
             user_ids = data
         
-        assert bob["id"] in user_ids
-        assert charlie["id"] in user_ids
+        assert {bob["id"], charlie["id"]} <= set(user_ids)
 
-    def test_get_likes_empty_list(self, client: TestClient):
+    def test_get_likes_empty_list(self, client: TestClient, baseline):
         """Getting likes for a post with no likes should return empty list."""
-        alice = create_user(client, "alice")
-        post = create_post(client, alice["id"])
         
-        response = client.get(f"/posts/{post['id']}/likes")
+        response = client.get(baseline.likes_url)
         assert response.status_code == 200
         data = response.json()
         
@@ -7,24 +7,18 @@ Tests cover Instagram-style post management including:
 - Listing posts with proper ordering and filtering
 """
 
+import itertools
+
 import pytest
 from fastapi.testclient import TestClient
 
-from app.main import app
 from app.models import reset_storage
 
 
-@pytest.fixture
-def client():
-    """Provide a fresh TestClient with reset storage for each test."""
-    reset_storage()
-    with TestClient(app) as c:
-        yield c
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def user_id(client: TestClient) -> str:
-    """Create and return a test user ID."""
+    """Register the module's test user once and return its ID."""
+    reset_storage()
     response = client.post(
         "/users",
         json={
@@ -34,50 +28,70 @@ def user_id(client: TestClient) -> str:
             "display_name": "Test User",
         },
     )
+    assert response.status_code == 201
     return response.json()["id"]
 
 
+@pytest.fixture(scope="module")
+def users_snapshot(user_id: str, snapshot_storage) -> dict:
+    """Storage snapshot taken right after the module's user was created."""
+    return snapshot_storage()
+
+
+@pytest.fixture(autouse=True)
+def clean_storage(users_snapshot: dict, restore_storage) -> None:
+    """Reset storage before each test, keeping the module's test user.
+
+    Posts tests never modify users, so the user is registered once per
+    module and restored from the snapshot rather than re-POSTed per test.
+    """
+    restore_storage(users_snapshot)
+
+
+@pytest.fixture
+def created_post(client: TestClient, user_id: str) -> dict:
+    """Create one image post for *user_id* and return the response body."""
+    response = client.post(
+        "/posts",
+        json={
+            "user_id": user_id,
+            "media_url": "https://example.com/image.jpg",
+            "media_type": "image",
+            "caption": "Test post",
+        },
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
 class TestPostCreation:
     """Tests for POST /posts (create post)."""
 
-    def test_create_post_with_image(self, client: TestClient, user_id: str):
-        """Test creating a post with image media returns 201."""
-        response = client.post(
-            "/posts",
-            json={
-                "user_id": user_id,
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {
                 "media_url": "https://example.com/image.jpg",
                 "media_type": "image",
                 "caption": "Check out this photo!",
             },
-        )
-        assert response.status_code == 201
-        data = response.json()
-        
-        assert "id" in data
-        assert data["user_id"] == user_id
-        assert data["media_url"] == "https://example.com/image.jpg"
-        assert data["media_type"] == "image"
-        assert data["caption"] == "Check out this photo!"
-        assert data["like_count"] == 0
-        assert data["share_count"] == 0
-
-    def test_create_post_with_video(self, client: TestClient, user_id: str):
-        """Test creating a post with video media returns 201."""
-        response = client.post(
-            "/posts",
-            json={
-                "user_id": user_id,
+            {
                 "media_url": "https://example.com/video.mp4",
                 "media_type": "video",
                 "caption": "Check out this video!",
             },
-        )
+        ],
+        ids=["image", "video"],
+    )
+    def test_create_post(self, client: TestClient, user_id: str, payload: dict):
+        """Test creating an image or video post returns 201 with every field set."""
+        response = client.post("/posts", json={"user_id": user_id, **payload})
         assert response.status_code == 201
         data = response.json()
-        
-        assert data["media_type"] == "video"
-        assert data["media_url"] == "https://example.com/video.mp4"
+
+        assert "id" in data
+        expected = {**payload, "user_id": user_id, "like_count": 0, "share_count": 0}
+        assert data.items() >= expected.items()
 
     def test_create_post_missing_media_url(self, client: TestClient, user_id: str):
         """Test that creating post without media_url returns 400."""
@@ -138,44 +152,25 @@ class TestPostCreation:
 class TestPostRetrieval:
     """Tests for GET /posts and GET /posts/{post_id}."""
 
-    def test_get_post_returns_correct_fields(self, client: TestClient, user_id: str):
-        """Test getting a post returns all fields with correct like/share counts."""
-        # Create a post
-        create_response = client.post(
-            "/posts",
-            json={
-                "user_id": user_id,
-                "media_url": "https://example.com/image.jpg",
-                "media_type": "image",
-                "caption": "Test post",
-            },
-        )
-        post_id = create_response.json()["id"]
-        
-        # Get the post
-        response = client.get(f"/posts/{post_id}")
+    def test_get_post_returns_correct_fields(self, client: TestClient, created_post: dict):
+        """Test getting a post returns the same fields it was created with."""
+        response = client.get(f"/posts/{created_post['id']}")
         assert response.status_code == 200
         data = response.json()
-        
-        assert data["id"] == post_id
-        assert data["user_id"] == user_id
-        assert data["media_url"] == "https://example.com/image.jpg"
-        assert data["media_type"] == "image"
-        assert data["caption"] == "Test post"
+
+        assert data == created_post
         assert data["like_count"] == 0
         assert data["share_count"] == 0
         assert "created_at" in data
 
-    def test_get_nonexistent_post_returns_404(self, client: TestClient):
-        """Test that getting a non-existent post returns 404."""
-        response = client.get("/posts/nonexistent-post-id")
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
-
-    def test_get_user_posts_newest_first(self, client: TestClient, user_id: str):
+    def test_get_user_posts_newest_first(self, client: TestClient, user_id: str, monkeypatch):
         """Test that getting user's posts returns them newest first."""
-        import time
-        
+        # Hand out strictly increasing timestamps instead of sleeping between posts.
+        ticks = itertools.count()
+        monkeypatch.setattr(
+            "app.models.now_utc", lambda: f"2025-01-01T00:00:{next(ticks):02d}"
+        )
+
         # Create first post
         post1_response = client.post(
             "/posts",
@@ -188,9 +183,6 @@ class TestPostRetrieval:
         )
         post1_id = post1_response.json()["id"]
         
-        # Small delay to ensure different timestamps
-        time.sleep(0.01)
-        
         # Create second post
         post2_response = client.post(
             "/posts",
@@ -224,20 +216,10 @@ class TestPostRetrieval:
 class TestPostDeletion:
     """Tests for DELETE /posts/{post_id}."""
 
-    def test_delete_post_success(self, client: TestClient, user_id: str):
+    def test_delete_post_success(self, client: TestClient, created_post: dict):
         """Test successful post deletion returns 200."""
-        # Create a post
-        create_response = client.post(
-            "/posts",
-            json={
-                "user_id": user_id,
-                "media_url": "https://example.com/image.jpg",
-                "media_type": "image",
-                "caption": "To be deleted",
-            },
-        )
-        post_id = create_response.json()["id"]
-        
+        post_id = created_post["id"]
+
         # Delete the post
         response = client.delete(f"/posts/{post_id}")
         assert response.status_code == 200
@@ -246,8 +228,13 @@ class TestPostDeletion:
         get_response = client.get(f"/posts/{post_id}")
         assert get_response.status_code == 404
 
-    def test_delete_nonexistent_post_returns_404(self, client: TestClient):
-        """Test that deleting a non-existent post returns 404."""
-        response = client.delete("/posts/nonexistent-post-id")
+
+class TestPostNotFound:
+    """Single-post endpoints return 404 for an unknown post id."""
+
+    @pytest.mark.parametrize("method", ["GET", "DELETE"])
+    def test_nonexistent_post_returns_404(self, client: TestClient, method: str):
+        """Test that getting or deleting a non-existent post returns 404."""
+        response = client.request(method, "/posts/nonexistent-post-id")
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
@@ -9,7 +9,7 @@ Covers:
 
 from __future__ import annotations
 
-import time
+import json
 
 import pytest
 from fastapi.testclient import TestClient
@@ -20,7 +20,6 @@ from src.url_shortener.rate_limiter import (
     RateLimitMiddleware,
     TokenBucket,
 )
-from src.url_shortener.main import app
 from src.url_shortener import storage
 
 
@@ -37,41 +36,90 @@ def clear_storage() -> None:
     storage.clear_store()
 
 
-def _get_middleware() -> RateLimitMiddleware:
-    """Return the RateLimitMiddleware instance attached to the app."""
-    for middleware in app.user_middleware:
-        if middleware.cls is RateLimitMiddleware:
-            # Accessing the built middleware stack is tricky; instead we
-            # reset via the app's middleware stack after it has been built.
-            break
-    # Walk the built ASGI stack to find our middleware instance.
-    layer = app.middleware_stack
-    while layer is not None:
-        if isinstance(layer, RateLimitMiddleware):
-            return layer
-        layer = getattr(layer, "app", None)
-    raise RuntimeError("RateLimitMiddleware not found in the middleware stack")
+class _FakeClock:
+    """Manually advanced stand-in for ``time.monotonic``."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+    """Drive every TokenBucket created during the test from a fake clock."""
+    fake = _FakeClock()
+    monkeypatch.setattr(TokenBucket, "_time", staticmethod(fake))
+    return fake
+
+
+async def _ok_app(scope: dict, receive, send) -> None:
+    """Minimal downstream ASGI app: answers every request with an empty 200."""
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+@pytest.fixture
+def bare_mw() -> RateLimitMiddleware:
+    """A RateLimitMiddleware wrapping only _ok_app, driven without HTTP."""
+    return RateLimitMiddleware(_ok_app)
+
+
+async def _asgi_get(
+    app, headers: dict[str, str] | None = None, client_host: str = "testclient"
+) -> tuple[int, bytes]:
+    """Send one GET straight into *app* as an ASGI call; return (status, body)."""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "query_string": b"",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        "client": (client_host, 50000),
+    }
+    sent: list[dict] = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+
+    await app(scope, receive, send)
+    status = next(m["status"] for m in sent if m["type"] == "http.response.start")
+    body = b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body")
+    return status, body
+
+
+@pytest.fixture
+def client(shortener_client: TestClient) -> TestClient:
+    return shortener_client
+
+
+@pytest.fixture(scope="module")
+def mw(shortener_app, shortener_client: TestClient) -> RateLimitMiddleware:
+    """The app's RateLimitMiddleware; depends on the client so the stack is built."""
+    return shortener_app.state.rate_limiter
 
 
 @pytest.fixture(autouse=True)
-def reset_rate_limiter() -> None:
-    """Reset per-IP bucket state before every test."""
-    try:
-        mw = _get_middleware()
-        mw.reset()
-    except RuntimeError:
-        pass  # middleware stack not yet built — harmless
+def reset_rate_limiter(mw: RateLimitMiddleware) -> None:
+    """Reset per-IP bucket state before and after every test."""
+    mw.reset()
     yield
-    try:
-        mw = _get_middleware()
-        mw.reset()
-    except RuntimeError:
-        pass
+    mw.reset()
 
 
-@pytest.fixture
-def client() -> TestClient:
-    return TestClient(app, follow_redirects=False)
+def _drain(bucket: TokenBucket) -> int:
+    """Consume single tokens until *bucket* refuses; return how many it gave."""
+    n = 0
+    while bucket.consume():
+        n += 1
+    return n
 
 
 # ===========================================================================
@@ -82,32 +130,28 @@ def client() -> TestClient:
 class TestTokenBucket:
     """Pure unit tests for TokenBucket with no I/O."""
 
-    def test_bucket_starts_full(self) -> None:
+    def test_bucket_starts_full(self, clock: _FakeClock) -> None:
         bucket = TokenBucket(capacity=10, refill_rate=1)
-        # All 10 tokens should be available immediately.
-        for _ in range(10):
-            assert bucket.consume() is True
+        # All 10 tokens should be available immediately, and no more.
+        assert _drain(bucket) == 10
 
-    def test_bucket_empty_returns_false(self) -> None:
+    def test_bucket_empty_returns_false(self, clock: _FakeClock) -> None:
         bucket = TokenBucket(capacity=3, refill_rate=1)
-        for _ in range(3):
-            bucket.consume()
+        _drain(bucket)
         assert bucket.consume() is False
 
-    def test_bucket_refills_over_time(self) -> None:
+    def test_bucket_refills_over_time(self, clock: _FakeClock) -> None:
         # 1 token/second, start empty.
         bucket = TokenBucket(capacity=5, refill_rate=1)
-        # Drain it.
-        while bucket.consume():
-            pass
-        # Wait slightly more than 1 second — should have ~1 token.
-        time.sleep(1.1)
+        _drain(bucket)
+        # Advance slightly more than 1 second — should have ~1 token.
+        clock.advance(1.1)
         assert bucket.consume() is True
 
-    def test_bucket_does_not_exceed_capacity(self) -> None:
+    def test_bucket_does_not_exceed_capacity(self, clock: _FakeClock) -> None:
         bucket = TokenBucket(capacity=5, refill_rate=100)
         # Even with a very high refill rate, tokens cap at capacity.
-        time.sleep(0.2)
+        clock.advance(10.0)
         assert bucket.tokens <= 5.0
 
     def test_bucket_tokens_property_is_non_negative(self) -> None:
@@ -131,6 +175,62 @@ class TestTokenBucket:
         assert bucket.consume(tokens=1) is False
 
 
+# ===========================================================================
+# Middleware unit tests — direct ASGI calls, no HTTP client
+# ===========================================================================
+
+
+@pytest.mark.anyio
+class TestRateLimitMiddlewareASGI:
+    """Drive RateLimitMiddleware with hand-built ASGI scopes.
+
+    These checks only need the middleware's decision, so they skip the
+    TestClient/httpx request and response machinery entirely.
+    """
+
+    async def test_request_over_limit_returns_429(self, bare_mw: RateLimitMiddleware) -> None:
+        """After exhausting the bucket, the next request must return 429."""
+        bare_mw._get_or_create_bucket("testclient")._tokens = 0
+        status, _ = await _asgi_get(bare_mw)
+        assert status == 429
+
+    async def test_429_response_has_detail_field(self, bare_mw: RateLimitMiddleware) -> None:
+        """429 body must include a 'detail' key."""
+        bare_mw._get_or_create_bucket("testclient")._tokens = 0
+        status, body = await _asgi_get(bare_mw)
+        assert status == 429
+        assert "detail" in json.loads(body)
+
+    async def test_different_ips_have_independent_buckets(
+        self, bare_mw: RateLimitMiddleware
+    ) -> None:
+        """Draining one IP's bucket must not affect another IP's bucket."""
+        # Drain IP A.
+        bare_mw._get_or_create_bucket("1.2.3.4")._tokens = 0
+
+        # IP B should still get through to the wrapped app.
+        status, _ = await _asgi_get(bare_mw, headers={"X-Forwarded-For": "9.9.9.9"})
+        assert status == 200
+
+    @pytest.mark.parametrize(
+        "xff,bucket_ip",
+        [
+            ("203.0.113.1", "203.0.113.1"),
+            # Header: "client, proxy" — only the first entry is the client.
+            ("10.0.0.1, 10.0.0.2", "10.0.0.1"),
+        ],
+        ids=["single", "first-of-many"],
+    )
+    async def test_x_forwarded_for_selects_bucket(
+        self, bare_mw: RateLimitMiddleware, xff: str, bucket_ip: str
+    ) -> None:
+        """The middleware keys buckets on the first X-Forwarded-For address."""
+        bare_mw._get_or_create_bucket(bucket_ip)._tokens = 0
+
+        status, _ = await _asgi_get(bare_mw, headers={"X-Forwarded-For": xff})
+        assert status == 429
+
+
 # ===========================================================================
 # Integration tests — RateLimitMiddleware via FastAPI TestClient
 # ===========================================================================
@@ -149,91 +249,25 @@ class TestRateLimitMiddleware:
             r = client.post("/shorten", json={"url": "https://example.com"})
             assert r.status_code == 201, f"Expected 201, got {r.status_code}"
 
-    def test_request_over_limit_returns_429(self, client: TestClient) -> None:
-        """After exhausting the bucket, the next request must return 429."""
-        mw = _get_middleware()
-        # Configure a tiny bucket directly so we don't have to make 100 calls.
-        mw.reset()
-        # Drain the default bucket for our test IP by poking it internally.
-        ip = "testclient"  # TestClient uses "testclient" as host
-        bucket = mw._get_or_create_bucket(ip)
-        # Manually drain to zero.
-        bucket._tokens = 0
-
-        r = client.post("/shorten", json={"url": "https://example.com"})
-        assert r.status_code == 429
-
-    def test_429_response_has_detail_field(self, client: TestClient) -> None:
-        """429 body must include a 'detail' key."""
-        mw = _get_middleware()
-        mw._get_or_create_bucket("testclient")._tokens = 0
-        r = client.get("/stats/doesnotexist")
-        assert r.status_code == 429
-        assert "detail" in r.json()
-
-    def test_429_response_has_retry_after_header(self, client: TestClient) -> None:
+    def test_429_response_has_retry_after_header(
+        self, client: TestClient, mw: RateLimitMiddleware
+    ) -> None:
         """429 response must include a Retry-After header."""
-        mw = _get_middleware()
         mw._get_or_create_bucket("testclient")._tokens = 0
         r = client.get("/stats/doesnotexist")
         assert r.status_code == 429
         assert "retry-after" in r.headers
         assert int(r.headers["retry-after"]) == int(WINDOW_SECONDS)
 
-    # -----------------------------------------------------------------------
-    # Per-IP isolation
-    # -----------------------------------------------------------------------
-
-    def test_different_ips_have_independent_buckets(self, client: TestClient) -> None:
-        """Draining one IP's bucket must not affect another IP's bucket."""
-        mw = _get_middleware()
-        # Drain IP A.
-        mw._get_or_create_bucket("1.2.3.4")._tokens = 0
-
-        # IP B should still succeed.
-        r = client.get(
-            "/stats/doesnotexist",
-            headers={"X-Forwarded-For": "9.9.9.9"},
-        )
-        # 404 means it got through the rate limiter — that's what we want.
-        assert r.status_code == 404
-
-    def test_x_forwarded_for_used_as_ip(self, client: TestClient) -> None:
-        """The middleware should honour X-Forwarded-For for the bucket key."""
-        mw = _get_middleware()
-        forwarded_ip = "203.0.113.1"
-        mw._get_or_create_bucket(forwarded_ip)._tokens = 0
-
-        r = client.get(
-            "/stats/any",
-            headers={"X-Forwarded-For": forwarded_ip},
-        )
-        assert r.status_code == 429
-
-    def test_x_forwarded_for_first_ip_used(self, client: TestClient) -> None:
-        """When X-Forwarded-For has multiple IPs, only the first is used."""
-        mw = _get_middleware()
-        real_client_ip = "10.0.0.1"
-        proxy_ip = "10.0.0.2"
-        mw._get_or_create_bucket(real_client_ip)._tokens = 0
-
-        # Header: "client, proxy"
-        r = client.get(
-            "/stats/any",
-            headers={"X-Forwarded-For": f"{real_client_ip}, {proxy_ip}"},
-        )
-        assert r.status_code == 429
-
     # -----------------------------------------------------------------------
     # Refill / recovery
     # -----------------------------------------------------------------------
 
     def test_bucket_refills_and_allows_requests_again(
-        self, client: TestClient
+        self, client: TestClient, mw: RateLimitMiddleware, clock: _FakeClock
     ) -> None:
         """After a brief wait, a drained bucket should start accepting again."""
         # Use a tiny capacity + fast refill so we don't sleep long.
-        mw = _get_middleware()
         ip = "testclient"
         # Replace the real bucket with a 1-token/second bucket.
         tiny_bucket = TokenBucket(capacity=1, refill_rate=1)
@@ -246,7 +280,7 @@ class TestRateLimitMiddleware:
         assert r1.status_code == 429
 
         # After ~1 s the bucket should refill one token.
-        time.sleep(1.1)
+        clock.advance(1.1)
         r2 = client.post("/shorten", json={"url": "https://example.com"})
         assert r2.status_code == 201
 
@@ -264,9 +298,17 @@ class TestRateLimitMiddleware:
     # Non-HTTP traffic passes through
     # -----------------------------------------------------------------------
 
-    def test_middleware_reset_clears_buckets(self) -> None:
+    def test_middleware_registers_itself_on_app_state(
+        self, shortener_app, mw: RateLimitMiddleware
+    ) -> None:
+        """The built stack's RateLimitMiddleware is reachable as app.state.rate_limiter."""
+        layer = shortener_app.middleware_stack
+        while not isinstance(layer, RateLimitMiddleware):
+            layer = layer.app
+        assert mw is layer
+
+    def test_middleware_reset_clears_buckets(self, mw: RateLimitMiddleware) -> None:
         """reset() should remove all stored buckets."""
-        mw = _get_middleware()
         mw._get_or_create_bucket("1.1.1.1")
         mw._get_or_create_bucket("2.2.2.2")
         mw.reset()
@@ -60,6 +60,10 @@ class TestSlugify:
         """Empty string returns empty string."""
         assert slugify("") == ""
 
+    def test_removed_characters_do_not_split_words(self) -> None:
+        """Dropped punctuation is removed in place rather than becoming a hyphen."""
+        assert slugify("Don't stop -- _now_ !") == "dont-stop-now"
+
 
 # ---------------------------------------------------------------------------
 # count_words
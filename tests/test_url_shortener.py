@@ -9,7 +9,6 @@ Covers:
 import pytest
 from fastapi.testclient import TestClient
 
-from src.url_shortener.main import app
 from src.url_shortener import storage
 
 
@@ -22,8 +21,8 @@ def clear_storage() -> None:
 
 
 @pytest.fixture
-def client() -> TestClient:
-    return TestClient(app, follow_redirects=False)
+def client(shortener_client: TestClient) -> TestClient:
+    return shortener_client
 
 
 # ---------------------------------------------------------------------------
@@ -9,16 +9,10 @@ Tests cover user account management including:
 import pytest
 from fastapi.testclient import TestClient
 
-from app.main import app
-from app.models import reset_storage
 
-
-@pytest.fixture
-def client():
-    """Provide a fresh TestClient with reset storage for each test."""
-    reset_storage()
-    with TestClient(app) as c:
-        yield c
+@pytest.fixture(autouse=True)
+def _reset(reset_stores):
+    """Start every test from empty stores; the client itself is session-wide."""
 
 
 class TestUserRegistration:
@@ -1,12 +1,11 @@
 """Pytest configuration for URL Shortener tests.
 
-Provides a fresh TestClient and auto-clears storage between tests.
+Points ``client`` at the shared shortener TestClient and auto-clears storage between tests.
 """
 
 import pytest
 from fastapi.testclient import TestClient
 
-from src.url_shortener.main import app
 from src.url_shortener import storage
 
 
@@ -19,6 +18,6 @@ def clear_storage() -> None:
 
 
 @pytest.fixture
-def client() -> TestClient:
-    """Return a TestClient that does NOT follow redirects (so we can assert 301)."""
-    return TestClient(app, follow_redirects=False)
+def client(shortener_client: TestClient) -> TestClient:
+    """Return the session's shortener TestClient (does NOT follow redirects)."""
+    return shortener_client
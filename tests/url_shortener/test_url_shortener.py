@@ -13,7 +13,6 @@ from datetime import datetime
 import pytest
 from fastapi.testclient import TestClient
 
-from src.url_shortener.main import app
 from src.url_shortener import storage
 
 
@@ -124,6 +123,11 @@ class TestRedirectEndpoint:
         response = client.get(f"/{code}")
         assert response.headers["location"] == url
 
+    def test_redirect_location_header_is_percent_encoded(self, client: TestClient) -> None:
+        code = self._shorten(client, "https://example.com/caf\u00e9 menu?q=1")
+        response = client.get(f"/{code}")
+        assert response.headers["location"] == "https://example.com/caf%C3%A9%20menu?q=1"
+
     def test_redirect_increments_click_count(self, client: TestClient) -> None:
         code = self._shorten(client, "https://example.com")
         client.get(f"/{code}")
@@ -284,3 +288,11 @@ class TestStorage:
         record = storage.get_url("abc1234")
         assert record is not None
         assert cached == record["original_url"]
+
+    def test_cache_put_evicts_least_recently_used(self, monkeypatch) -> None:
+        monkeypatch.setattr(storage, "_LRU_CAPACITY", 2)
+        storage._cache_put("a", "https://a.com")
+        storage._cache_put("b", "https://b.com")
+        storage._cache_get("a")  # "b" is now least recently used
+        storage._cache_put("c", "https://c.com")
+        assert list(storage._url_cache) == ["a", "c"]
@@ -1,6 +1,7 @@
 """FastAPI application entry point for the Uber-like ride-hailing app."""
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from uber_app.routers import drivers, riders, rides
 
@@ -8,6 +9,7 @@ app = FastAPI(
     title="Uber-like Ride-Hailing App",
     description="A simple ride-hailing platform supporting riders, drivers, and ride matching.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(riders.router)
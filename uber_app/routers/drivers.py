@@ -10,10 +10,12 @@ Endpoints:
 
 from __future__ import annotations
 
-import uuid
 from typing import List
+from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException, status
+import orjson
+from fastapi import APIRouter, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
 
 from uber_app import storage
 from uber_app.models import DriverCreate, DriverResponse, DriverUpdate, RideResponse
@@ -26,20 +28,12 @@ router = APIRouter(prefix="/api/drivers", tags=["drivers"])
 # ---------------------------------------------------------------------------
 
 @router.post("", response_model=DriverResponse, status_code=status.HTTP_201_CREATED)
-def create_driver(body: DriverCreate) -> DriverResponse:
+async def create_driver(body: DriverCreate) -> storage.DriverRecord:
     """AC6 — Register a new driver with vehicle details."""
-    driver_id = str(uuid.uuid4())
-    driver: dict = {
-        "id": driver_id,
-        "name": body.name,
-        "email": body.email,
-        "phone": body.phone,
-        "vehicle_make": body.vehicle_make,
-        "vehicle_model": body.vehicle_model,
-        "license_plate": body.license_plate,
-    }
+    driver_id = str(uuid4())
+    driver = storage.DriverRecord(id=driver_id, **body.model_dump())
     storage.drivers[driver_id] = driver
-    return DriverResponse(**driver)
+    return driver
 
 
 # ---------------------------------------------------------------------------
@@ -47,12 +41,23 @@ def create_driver(body: DriverCreate) -> DriverResponse:
 # ---------------------------------------------------------------------------
 
 @router.get("/{driver_id}", response_model=DriverResponse)
-def get_driver(driver_id: str) -> DriverResponse:
-    """Return a driver's profile by ID."""
-    driver = storage.drivers.get(driver_id)
-    if driver is None:
-        raise HTTPException(status_code=404, detail="Driver not found")
-    return DriverResponse(**driver)
+async def get_driver(driver_id: str) -> Response:
+    """
+    Return a driver's profile by ID.
+
+    The encoded body is cached in storage.driver_json_cache on first read, so
+    repeat reads skip model construction and JSON encoding entirely.
+    """
+    body = storage.driver_json_cache.get(driver_id)
+    if body is None:
+        driver = storage.drivers.get(driver_id)
+        if driver is None:
+            raise HTTPException(status_code=404, detail="Driver not found")
+        # orjson encodes the slotted record directly, fields in declaration
+        # order, which matches DriverResponse.
+        body = orjson.dumps(driver)
+        storage.driver_json_cache[driver_id] = body
+    return Response(content=body, media_type="application/json")
 
 
 # ---------------------------------------------------------------------------
@@ -60,7 +65,7 @@ def get_driver(driver_id: str) -> DriverResponse:
 # ---------------------------------------------------------------------------
 
 @router.put("/{driver_id}", response_model=DriverResponse)
-def update_driver(driver_id: str, body: DriverUpdate) -> DriverResponse:
+async def update_driver(driver_id: str, body: DriverUpdate) -> storage.DriverRecord:
     """
     Partially update a driver's profile.
 
@@ -71,11 +76,16 @@ def update_driver(driver_id: str, body: DriverUpdate) -> DriverResponse:
     if driver is None:
         raise HTTPException(status_code=404, detail="Driver not found")
 
-    update_data = body.model_dump(exclude_none=True)
-    driver.update(update_data)
-    storage.drivers[driver_id] = driver
+    # Copy only the fields the client sent; an explicit null leaves the
+    # stored value alone.  ``driver`` is the stored record itself, so the
+    # update is visible in storage without writing it back.
+    for field in body.model_fields_set:
+        value = getattr(body, field)
+        if value is not None:
+            setattr(driver, field, value)
+    storage.driver_json_cache.pop(driver_id, None)
 
-    return DriverResponse(**driver)
+    return driver
 
 
 # ---------------------------------------------------------------------------
@@ -83,8 +93,19 @@ def update_driver(driver_id: str, body: DriverUpdate) -> DriverResponse:
 # ---------------------------------------------------------------------------
 
 @router.get("/{driver_id}/rides", response_model=List[RideResponse])
-def get_driver_rides(driver_id: str) -> List[dict]:
-    """AC10 — Return all rides assigned to a given driver."""
-    if driver_id not in storage.drivers:
-        raise HTTPException(status_code=404, detail="Driver not found")
-    return [r for r in storage.rides.values() if r.get("driver_id") == driver_id]
+async def get_driver_rides(driver_id: str) -> ORJSONResponse:
+    """
+    AC10 — Return all rides assigned to a given driver, oldest first.
+
+    Reads the storage.rides_by_driver index, so the cost is proportional to
+    the driver's own rides rather than to every ride in storage, and encodes
+    the records directly with orjson.
+    """
+    driver_rides = storage.rides_by_driver.get(driver_id)
+    if driver_rides is None:
+        # Only drivers who have accepted a ride have an index entry, so fall
+        # back to the driver store to tell "no rides yet" from "no driver".
+        if driver_id not in storage.drivers:
+            raise HTTPException(status_code=404, detail="Driver not found")
+        return ORJSONResponse([])
+    return ORJSONResponse(storage.in_creation_order(driver_rides))
@@ -2,10 +2,11 @@
 Riders router — rider registration and ride history.
 """
 
-import uuid
 from typing import List
+from uuid import uuid4
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from uber_app import models, storage
 
@@ -17,10 +18,10 @@ router = APIRouter(prefix="/api/riders", tags=["riders"])
 # ---------------------------------------------------------------------------
 
 @router.post("", response_model=models.RiderResponse, status_code=201)
-def create_rider(rider_in: models.RiderCreate) -> dict:
+async def create_rider(rider_in: models.RiderCreate) -> storage.RiderRecord:
     """AC1 — Register a new rider."""
-    rider_id = str(uuid.uuid4())
-    rider_data: dict = {"id": rider_id, **rider_in.model_dump()}
+    rider_id = str(uuid4())
+    rider_data = storage.RiderRecord(id=rider_id, **rider_in.model_dump())
     storage.riders[rider_id] = rider_data
     return rider_data
 
@@ -30,12 +31,12 @@ def create_rider(rider_in: models.RiderCreate) -> dict:
 # ---------------------------------------------------------------------------
 
 @router.get("/{rider_id}", response_model=models.RiderResponse)
-def get_rider(rider_id: str) -> dict:
-    """Return a rider by ID."""
+async def get_rider(rider_id: str) -> ORJSONResponse:
+    """Return a rider by ID, encoded directly by orjson."""
     rider = storage.riders.get(rider_id)
     if rider is None:
         raise HTTPException(status_code=404, detail="Rider not found")
-    return rider
+    return ORJSONResponse(rider)
 
 
 # ---------------------------------------------------------------------------
@@ -43,8 +44,17 @@ def get_rider(rider_id: str) -> dict:
 # ---------------------------------------------------------------------------
 
 @router.get("/{rider_id}/rides", response_model=List[models.RideResponse])
-def get_rider_rides(rider_id: str) -> List[dict]:
-    """AC6 — Return all rides for a given rider."""
-    if rider_id not in storage.riders:
-        raise HTTPException(status_code=404, detail="Rider not found")
-    return [r for r in storage.rides.values() if r["rider_id"] == rider_id]
+async def get_rider_rides(rider_id: str) -> ORJSONResponse:
+    """
+    AC6 — Return all rides for a given rider, oldest first.
+
+    Reads the storage.rides_by_rider index rather than scanning every ride,
+    and encodes the records directly with orjson.
+    """
+    rider_rides = storage.rides_by_rider.get(rider_id)
+    if rider_rides is None:
+        # Only riders who have requested a ride have an index entry.
+        if rider_id not in storage.riders:
+            raise HTTPException(status_code=404, detail="Rider not found")
+        return ORJSONResponse([])
+    return ORJSONResponse(list(rider_rides.values()))
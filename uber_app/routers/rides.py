@@ -8,20 +8,61 @@ Status flow:
     requested → cancelled  (rider cancels)
 """
 
-import uuid
+from dataclasses import replace
 from datetime import datetime, timezone
 from typing import List, Optional
+from uuid import uuid4
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
 from uber_app import models, storage
 
 router = APIRouter(prefix="/api/rides", tags=["rides"])
 
+_UTC = timezone.utc
+
 
 def _now_iso() -> str:
     """Return current UTC time as ISO-8601 string."""
-    return datetime.now(timezone.utc).isoformat()
+    return datetime.now(_UTC).isoformat()
+
+
+def _publish(ride: storage.RideRecord, **changes) -> storage.RideRecord:
+    """
+    Store an updated copy of *ride* and return it.
+
+    Records are never changed in place, so a record already handed to a
+    reader is never seen half-way through a transition.
+    """
+    updated = replace(ride, updated_at=_now_iso(), **changes)
+    storage.rides[ride.id] = updated
+    storage.rides_by_rider[ride.rider_id][ride.id] = updated
+    del storage.rides_by_status[ride.status][ride.id]
+    storage.rides_by_status[updated.status][ride.id] = updated
+    if updated.driver_id is not None:
+        # Replacing an existing entry keeps its position in the driver's index.
+        storage.rides_by_driver.setdefault(updated.driver_id, {})[ride.id] = updated
+    return updated
+
+
+def _unassign_driver(ride: storage.RideRecord) -> storage.RideRecord:
+    """Put an accepted ride back to "requested" and drop it from its driver's index."""
+    storage.rides_by_driver[ride.driver_id].pop(ride.id, None)
+    return _publish(ride, status="requested", driver_id=None)
+
+
+def _cancel_ride(ride: storage.RideRecord) -> storage.RideRecord:
+    """Mark a requested ride as cancelled."""
+    return _publish(ride, status="cancelled")
+
+
+# PUT /{ride_id}/cancel rules by cancelling party: the status the ride must
+# be in, the 409 message, and the transition to apply.
+_CANCEL_RULES = {
+    "rider": ("requested", "Rider can only cancel a 'requested' ride", _cancel_ride),
+    "driver": ("accepted", "Driver can only cancel an 'accepted' ride", _unassign_driver),
+}
 
 
 # ---------------------------------------------------------------------------
@@ -29,7 +70,7 @@ def _now_iso() -> str:
 # ---------------------------------------------------------------------------
 
 @router.post("", response_model=models.RideResponse, status_code=201)
-def create_ride(ride_in: models.RideCreate) -> models.RideResponse:
+async def create_ride(ride_in: models.RideCreate) -> storage.RideRecord:
     """
     AC2, AC3 — Request a ride (for self or a family member).
 
@@ -41,23 +82,22 @@ def create_ride(ride_in: models.RideCreate) -> models.RideResponse:
 
     is_family_ride = bool(ride_in.passenger_name and ride_in.passenger_phone)
     now = _now_iso()
-    ride_id = str(uuid.uuid4())
-
-    ride_data: dict = {
-        "id": ride_id,
-        "rider_id": ride_in.rider_id,
-        "driver_id": None,
-        "pickup_location": ride_in.pickup_location,
-        "dropoff_location": ride_in.dropoff_location,
-        "status": "requested",
-        "passenger_name": ride_in.passenger_name,
-        "passenger_phone": ride_in.passenger_phone,
-        "is_family_ride": is_family_ride,
-        "created_at": now,
-        "updated_at": now,
-    }
-
-    storage.rides[ride_id] = ride_data
+    ride_id = str(uuid4())
+
+    ride_data = storage.RideRecord(
+        id=ride_id,
+        rider_id=ride_in.rider_id,
+        pickup_location=ride_in.pickup_location,
+        dropoff_location=ride_in.dropoff_location,
+        status="requested",
+        created_at=now,
+        updated_at=now,
+        passenger_name=ride_in.passenger_name,
+        passenger_phone=ride_in.passenger_phone,
+        is_family_ride=is_family_ride,
+    )
+
+    storage.add_ride(ride_data)
     return ride_data
 
 
@@ -66,18 +106,25 @@ def create_ride(ride_in: models.RideCreate) -> models.RideResponse:
 # ---------------------------------------------------------------------------
 
 @router.get("", response_model=List[models.RideResponse])
-def list_rides(
+async def list_rides(
     status: Optional[str] = Query(default=None, description="Filter by ride status"),
-) -> List[dict]:
+) -> ORJSONResponse:
     """
     AC7 — Return all rides, optionally filtered by ?status=<value>.
 
     Valid status values: requested, accepted, completed, cancelled.
+
+    The records are trusted storage data, so they are handed straight to
+    orjson, which encodes dataclasses natively; response_model only
+    documents the shape and no per-item Pydantic validation runs.
     """
-    all_rides = list(storage.rides.values())
-    if status is not None:
-        all_rides = [r for r in all_rides if r["status"] == status]
-    return all_rides
+    if status is None:
+        return ORJSONResponse(list(storage.rides.values()))
+    # Filtered reads come straight from the per-status index, returned in
+    # creation order like the unfiltered list; an unknown status has no
+    # bucket and matches nothing.
+    bucket = storage.rides_by_status.get(status)
+    return ORJSONResponse(storage.in_creation_order(bucket) if bucket is not None else [])
 
 
 # ---------------------------------------------------------------------------
@@ -85,12 +132,12 @@ def list_rides(
 # ---------------------------------------------------------------------------
 
 @router.get("/{ride_id}", response_model=models.RideResponse)
-def get_ride(ride_id: str) -> models.RideResponse:
-    """AC5 — Return a single ride by ID."""
+async def get_ride(ride_id: str) -> ORJSONResponse:
+    """AC5 — Return a single ride by ID, encoded directly by orjson."""
     ride = storage.rides.get(ride_id)
     if ride is None:
         raise HTTPException(status_code=404, detail="Ride not found")
-    return ride
+    return ORJSONResponse(ride)
 
 
 # ---------------------------------------------------------------------------
@@ -98,7 +145,7 @@ def get_ride(ride_id: str) -> models.RideResponse:
 # ---------------------------------------------------------------------------
 
 @router.put("/{ride_id}/accept", response_model=models.RideResponse)
-def accept_ride(ride_id: str, body: models.AcceptRideRequest) -> dict:
+async def accept_ride(ride_id: str, body: models.AcceptRideRequest) -> storage.RideRecord:
     """
     AC8 — A driver accepts a requested ride.
 
@@ -111,19 +158,16 @@ def accept_ride(ride_id: str, body: models.AcceptRideRequest) -> dict:
         raise HTTPException(status_code=404, detail="Ride not found")
 
     # Check status before driver existence so already-accepted returns 409
-    if ride["status"] != "requested":
+    if ride.status != "requested":
         raise HTTPException(
             status_code=409,
-            detail=f"Cannot accept ride with status '{ride['status']}'. Ride must be in 'requested' state.",
+            detail=f"Cannot accept ride with status '{ride.status}'. Ride must be in 'requested' state.",
         )
 
     if body.driver_id not in storage.drivers:
         raise HTTPException(status_code=404, detail="Driver not found")
 
-    ride["driver_id"] = body.driver_id
-    ride["status"] = "accepted"
-    ride["updated_at"] = _now_iso()
-    return ride
+    return _publish(ride, status="accepted", driver_id=body.driver_id)
 
 
 # ---------------------------------------------------------------------------
@@ -131,7 +175,7 @@ def accept_ride(ride_id: str, body: models.AcceptRideRequest) -> dict:
 # ---------------------------------------------------------------------------
 
 @router.put("/{ride_id}/complete", response_model=models.RideResponse)
-def complete_ride(ride_id: str, body: models.CompleteRideRequest) -> dict:
+async def complete_ride(ride_id: str, body: models.CompleteRideRequest) -> storage.RideRecord:
     """
     AC9 — Mark an accepted ride as completed.
 
@@ -143,21 +187,19 @@ def complete_ride(ride_id: str, body: models.CompleteRideRequest) -> dict:
     if ride is None:
         raise HTTPException(status_code=404, detail="Ride not found")
 
-    if ride["status"] != "accepted":
+    if ride.status != "accepted":
         raise HTTPException(
             status_code=409,
-            detail=f"Cannot complete ride with status '{ride['status']}'. Ride must be in 'accepted' state.",
+            detail=f"Cannot complete ride with status '{ride.status}'. Ride must be in 'accepted' state.",
         )
 
-    if ride["driver_id"] != body.driver_id:
+    if ride.driver_id != body.driver_id:
         raise HTTPException(
             status_code=403,
             detail="Only the assigned driver can complete this ride.",
         )
 
-    ride["status"] = "completed"
-    ride["updated_at"] = _now_iso()
-    return ride
+    return _publish(ride, status="completed")
 
 
 # ---------------------------------------------------------------------------
@@ -165,7 +207,7 @@ def complete_ride(ride_id: str, body: models.CompleteRideRequest) -> dict:
 # ---------------------------------------------------------------------------
 
 @router.put("/{ride_id}/rider-cancel", response_model=models.RideResponse)
-def rider_cancel_ride(ride_id: str) -> dict:
+async def rider_cancel_ride(ride_id: str) -> storage.RideRecord:
     """
     AC13 — Rider cancels their own ride request.
 
@@ -177,15 +219,13 @@ def rider_cancel_ride(ride_id: str) -> dict:
     if ride is None:
         raise HTTPException(status_code=404, detail="Ride not found")
 
-    if ride["status"] != "requested":
+    if ride.status != "requested":
         raise HTTPException(
             status_code=409,
-            detail=f"Rider can only cancel a 'requested' ride, current status: '{ride['status']}'.",
+            detail=f"Rider can only cancel a 'requested' ride, current status: '{ride.status}'.",
         )
 
-    ride["status"] = "cancelled"
-    ride["updated_at"] = _now_iso()
-    return ride
+    return _cancel_ride(ride)
 
 
 # ---------------------------------------------------------------------------
@@ -193,7 +233,9 @@ def rider_cancel_ride(ride_id: str) -> dict:
 # ---------------------------------------------------------------------------
 
 @router.put("/{ride_id}/cancel", response_model=models.RideResponse)
-def driver_cancel_ride(ride_id: str, body: Optional[models.CancelRideRequest] = None) -> dict:
+async def driver_cancel_ride(
+    ride_id: str, body: Optional[models.CancelRideRequest] = None
+) -> storage.RideRecord:
     """
     Driver cancel endpoint — reverts an accepted ride back to "requested".
 
@@ -208,39 +250,13 @@ def driver_cancel_ride(ride_id: str, body: Optional[models.CancelRideRequest] =
     if ride is None:
         raise HTTPException(status_code=404, detail="Ride not found")
 
-    # If a body is provided, use it to determine cancel type (legacy support)
-    if body is not None:
-        # Rider cancel via body
-        if body.rider_id is not None:
-            if ride["status"] != "requested":
-                raise HTTPException(
-                    status_code=409,
-                    detail=f"Rider can only cancel a 'requested' ride, current status: '{ride['status']}'.",
-                )
-            ride["status"] = "cancelled"
-            ride["updated_at"] = _now_iso()
-            return ride
-
-        # Driver cancel via body
-        if body.driver_id is not None:
-            if ride["status"] != "accepted":
-                raise HTTPException(
-                    status_code=409,
-                    detail=f"Driver can only cancel an 'accepted' ride, current status: '{ride['status']}'.",
-                )
-            ride["status"] = "requested"
-            ride["driver_id"] = None
-            ride["updated_at"] = _now_iso()
-            return ride
-
-    # No body or empty body — treat as driver-style cancel (must be accepted)
-    if ride["status"] != "accepted":
+    # A body naming a rider_id is the legacy rider cancel; anything else,
+    # including no body at all, is a driver cancel.
+    kind = "rider" if body is not None and body.rider_id is not None else "driver"
+    required_status, message, apply = _CANCEL_RULES[kind]
+    if ride.status != required_status:
         raise HTTPException(
             status_code=409,
-            detail=f"Driver can only cancel an 'accepted' ride, current status: '{ride['status']}'.",
+            detail=f"{message}, current status: '{ride.status}'.",
         )
-
-    ride["status"] = "requested"
-    ride["driver_id"] = None
-    ride["updated_at"] = _now_iso()
-    return ride
+    return apply(ride)
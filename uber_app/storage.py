@@ -1,13 +1,95 @@
 """
 In-memory data store.
 
-Each dict maps ID (str) → dict representation of the entity.
+Each dict maps ID (str) → the entity's record, a slotted dataclass.  Slots
+keep each record to a fixed-size object instead of a per-record hash table,
+and FastAPI serialises the records against the routers' response models.
 These are module-level singletons shared across all imports.
+
+rides_by_rider is a secondary index, rider_id → {ride_id: RideRecord} in
+creation order.  It holds the same record objects as rides; rides never
+change rider and are never deleted, so only add_ride adds entries and
+transitions only replace the entry's record.
+
+ride_seq maps ride_id → the ride's creation sequence number, assigned by
+add_ride.  Indexes whose insertion order is not creation order are read back
+through in_creation_order, which sorts by it; unlike created_at it never ties.
+
+rides_by_driver is a secondary index, driver_id → {ride_id: RideRecord} for
+the rides currently assigned to that driver.  The rides router's _publish
+files a ride under its driver, and a driver cancel removes it, so it stays in
+step with rides[...].driver_id.  Entries are in acceptance order; read it
+through in_creation_order.
+
+rides_by_status is a secondary index, status → {ride_id: RideRecord}, with one
+bucket per ride status.  A ride sits in exactly one bucket, that of its
+current status.  add_ride files new rides, and every transition goes through
+the rides router's _publish, which moves the ride between buckets.  Entries
+are in the order rides entered the status; read them through
+in_creation_order.
+
+The uber_app handlers are all async and never await, so every read and
+transition runs start to finish on the event loop without interleaving, and
+the stores need no locks.  Ride records are still never mutated once stored:
+a transition stores an updated copy in rides and the indexes, so a record
+already handed to a response is never seen half-updated.
+
+driver_json_cache maps driver_id → the encoded GET /api/drivers/{id} body.
+It is filled lazily by get_driver and must be invalidated by any handler
+that mutates a driver record.
 """
 
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class RiderRecord:
+    id: str
+    name: str
+    email: str
+    phone: str
+
+
+@dataclass(slots=True)
+class DriverRecord:
+    id: str
+    name: str
+    email: str
+    phone: str
+    vehicle_make: str
+    vehicle_model: str
+    license_plate: str
+
+
+@dataclass(slots=True)
+class RideRecord:
+    id: str
+    rider_id: str
+    pickup_location: str
+    dropoff_location: str
+    status: str  # requested | accepted | completed | cancelled
+    created_at: str
+    updated_at: str
+    driver_id: Optional[str] = None
+    passenger_name: Optional[str] = None
+    passenger_phone: Optional[str] = None
+    is_family_ride: bool = False
+
+
 riders: dict = {}
 drivers: dict = {}
 rides: dict = {}
+rides_by_rider: dict = {}
+rides_by_driver: dict = {}
+ride_seq: dict = {}
+driver_json_cache: dict = {}
+rides_by_status: dict = {
+    "requested": {},
+    "accepted": {},
+    "completed": {},
+    "cancelled": {},
+}
 
 
 def clear_all() -> None:
@@ -15,3 +97,24 @@ def clear_all() -> None:
     riders.clear()
     drivers.clear()
     rides.clear()
+    rides_by_rider.clear()
+    rides_by_driver.clear()
+    ride_seq.clear()
+    driver_json_cache.clear()
+    # The buckets are fixed, so empty them rather than the outer dict.
+    for bucket in rides_by_status.values():
+        bucket.clear()
+
+
+def add_ride(ride: RideRecord) -> None:
+    """Store a new ride in rides and in every index it belongs to."""
+    # Rides are never deleted, so the store's size is a monotonic sequence.
+    ride_seq[ride.id] = len(rides)
+    rides[ride.id] = ride
+    rides_by_rider.setdefault(ride.rider_id, {})[ride.id] = ride
+    rides_by_status[ride.status][ride.id] = ride
+
+
+def in_creation_order(index: dict) -> list:
+    """Return the records of a {ride_id: RideRecord} index, oldest-created first."""
+    return [index[ride_id] for ride_id in sorted(index, key=ride_seq.__getitem__)]
@@ -1,5 +1,10 @@
 """Shared pytest fixtures for the Uber app test suite."""
 
+import re
+from dataclasses import asdict
+from datetime import datetime, timezone
+from uuid import uuid4
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -7,6 +12,13 @@ from uber_app.main import app
 from uber_app import storage
 
 
+# Standard 8-4-4-4-12 hexadecimal UUID format, shared by the ID assertions.
+UUID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
+    re.IGNORECASE,
+)
+
+
 @pytest.fixture(autouse=True)
 def clear_storage():
     """Reset in-memory storage before every test to ensure isolation."""
@@ -15,59 +27,75 @@ def clear_storage():
     storage.clear_all()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client() -> TestClient:
-    """FastAPI test client."""
-    return TestClient(app)
+    """FastAPI test client, shared by the whole session.
+
+    Storage is reset per test by clear_storage; the client itself holds no
+    per-test state, so it is built (and its lifespan entered) only once.
+    """
+    with TestClient(app) as c:
+        yield c
 
 
 @pytest.fixture
-def sample_rider(client: TestClient) -> dict:
-    """Create and return a test rider."""
-    resp = client.post(
-        "/api/riders",
-        json={"name": "John Doe", "email": "john@example.com", "phone": "555-0100"},
+def sample_rider() -> dict:
+    """Store and return a test rider.
+
+    Written straight into storage: the rider endpoints have their own
+    tests, so fixtures need not pay for an HTTP round-trip.
+    """
+    rider = storage.RiderRecord(
+        id=str(uuid4()), name="John Doe", email="john@example.com", phone="555-0100"
     )
-    assert resp.status_code == 201
-    return resp.json()
+    storage.riders[rider.id] = rider
+    return asdict(rider)
 
 
 @pytest.fixture
-def sample_driver(client: TestClient) -> dict:
-    """Create and return a test driver."""
-    resp = client.post(
-        "/api/drivers",
-        json={
-            "name": "Jane Driver",
-            "email": "jane@example.com",
-            "phone": "555-0200",
-            "vehicle_make": "Toyota",
-            "vehicle_model": "Camry",
-            "license_plate": "ABC-1234",
-        },
+def sample_driver() -> dict:
+    """Store and return a test driver, written straight into storage."""
+    driver = storage.DriverRecord(
+        id=str(uuid4()),
+        name="Jane Driver",
+        email="jane@example.com",
+        phone="555-0200",
+        vehicle_make="Toyota",
+        vehicle_model="Camry",
+        license_plate="ABC-1234",
     )
-    assert resp.status_code == 201
-    return resp.json()
+    storage.drivers[driver.id] = driver
+    return asdict(driver)
 
 
 @pytest.fixture
-def sample_ride(client: TestClient, sample_rider: dict) -> dict:
-    """Create and return a test ride in 'requested' status."""
-    resp = client.post(
-        "/api/rides",
-        json={
-            "rider_id": sample_rider["id"],
-            "pickup_location": "123 Main St",
-            "dropoff_location": "456 Oak Ave",
-        },
+def sample_ride(sample_rider: dict) -> dict:
+    """Store and return a test ride in 'requested' status.
+
+    Seeded through storage.add_ride so every ride index is filled exactly
+    as create_ride would; POST /api/rides itself is covered in test_rides.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    ride = storage.RideRecord(
+        id=str(uuid4()),
+        rider_id=sample_rider["id"],
+        pickup_location="123 Main St",
+        dropoff_location="456 Oak Ave",
+        status="requested",
+        created_at=now,
+        updated_at=now,
     )
-    assert resp.status_code == 201
-    return resp.json()
+    storage.add_ride(ride)
+    return asdict(ride)
 
 
 @pytest.fixture
 def accepted_ride(client: TestClient, sample_ride: dict, sample_driver: dict) -> dict:
-    """Create a ride that has been accepted by a driver."""
+    """Create a ride that has been accepted by a driver.
+
+    Goes through PUT /accept, so the driver index and status bucket are
+    updated by the real transition.
+    """
     resp = client.put(
         f"/api/rides/{sample_ride['id']}/accept",
         json={"driver_id": sample_driver["id"]},
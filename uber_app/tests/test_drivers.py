@@ -1,9 +1,10 @@
 """Tests for the Drivers router."""
 
-import re
 import pytest
 from fastapi.testclient import TestClient
 
+from uber_app.tests.conftest import UUID_RE
+
 
 def test_create_driver(client: TestClient):
     """Test creating a driver with valid data — AC6.
@@ -56,7 +57,7 @@ def test_create_driver_fields(client: TestClient):
         "id", "name", "email", "phone",
         "vehicle_make", "vehicle_model", "license_plate"
     }
-    assert set(data.keys()) == expected_fields
+    assert data.keys() == expected_fields
 
     # Verify vehicle-specific fields
     assert data["vehicle_make"] == "Ford"
@@ -119,11 +120,7 @@ def test_driver_id_is_uuid(client: TestClient):
     assert response.status_code == 201
     data = response.json()
 
-    uuid_pattern = re.compile(
-        r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-        re.IGNORECASE
-    )
-    assert uuid_pattern.match(data["id"]), f"ID {data['id']} is not a valid UUID"
+    assert UUID_RE.match(data["id"]), f"ID {data['id']} is not a valid UUID"
 
 
 def test_rider_id_is_uuid(client: TestClient):
@@ -140,11 +137,7 @@ def test_rider_id_is_uuid(client: TestClient):
     assert response.status_code == 201
     data = response.json()
 
-    uuid_pattern = re.compile(
-        r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-        re.IGNORECASE
-    )
-    assert uuid_pattern.match(data["id"]), f"ID {data['id']} is not a valid UUID"
+    assert UUID_RE.match(data["id"]), f"ID {data['id']} is not a valid UUID"
 
 
 def test_get_driver(client: TestClient, sample_driver: dict):
@@ -209,6 +202,32 @@ def test_update_driver_vehicle_info(client: TestClient, sample_driver: dict):
     assert data["email"] == sample_driver["email"]
 
 
+def test_update_driver_explicit_null_keeps_value(client: TestClient, sample_driver: dict):
+    """Test that sending null for a field leaves the stored value unchanged."""
+    driver_id = sample_driver["id"]
+    response = client.put(
+        f"/api/drivers/{driver_id}",
+        json={"name": None, "phone": "555-9999"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == sample_driver["name"]
+    assert data["phone"] == "555-9999"
+
+
+def test_get_driver_reflects_update_after_cached_read(client: TestClient, sample_driver: dict):
+    """Test that a GET after PUT returns the updated profile, not a cached one."""
+    driver_id = sample_driver["id"]
+    assert client.get(f"/api/drivers/{driver_id}").json() == sample_driver
+
+    client.put(f"/api/drivers/{driver_id}", json={"name": "Renamed Driver"})
+
+    response = client.get(f"/api/drivers/{driver_id}")
+    assert response.status_code == 200
+    assert response.json() == {**sample_driver, "name": "Renamed Driver"}
+
+
 def test_update_driver_not_found(client: TestClient):
     """Test updating a nonexistent driver returns 404."""
     response = client.put(
@@ -262,3 +281,45 @@ def test_get_driver_rides_after_acceptance(
     assert data[0]["id"] == ride_id
     assert data[0]["driver_id"] == driver_id
     assert data[0]["status"] == "accepted"
+
+
+def test_get_driver_rides_excludes_cancelled_assignment(
+    client: TestClient, accepted_ride: dict, sample_driver: dict
+):
+    """Test that a ride the driver cancelled drops out of their ride history."""
+    driver_id = sample_driver["id"]
+
+    client.put(f"/api/rides/{accepted_ride['id']}/cancel")
+
+    response = client.get(f"/api/drivers/{driver_id}/rides")
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_get_driver_rides_in_creation_order(
+    client: TestClient, sample_rider: dict, sample_driver: dict
+):
+    """Test that ride history lists rides oldest-created first, however accepted."""
+    driver_id = sample_driver["id"]
+    ride_ids = [
+        client.post("/api/rides", json={
+            "rider_id": sample_rider["id"],
+            "pickup_location": f"{n} Main St",
+            "dropoff_location": "200 Oak Ave",
+        }).json()["id"]
+        for n in range(3)
+    ]
+
+    # Accept newest first, then cancel and re-accept the oldest ride and
+    # complete the middle one; none of that may reorder the history.
+    for ride_id in reversed(ride_ids):
+        client.put(f"/api/rides/{ride_id}/accept", json={"driver_id": driver_id})
+    client.put(f"/api/rides/{ride_ids[0]}/cancel")
+    client.put(f"/api/rides/{ride_ids[0]}/accept", json={"driver_id": driver_id})
+    client.put(f"/api/rides/{ride_ids[1]}/complete", json={"driver_id": driver_id})
+
+    response = client.get(f"/api/drivers/{driver_id}/rides")
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["id"] for r in data] == ride_ids
+    assert data[1]["status"] == "completed"
@@ -1,9 +1,10 @@
 """Tests for the Riders router."""
 
-import re
 import pytest
 from fastapi.testclient import TestClient
 
+from uber_app.tests.conftest import UUID_RE
+
 
 def test_create_rider(client: TestClient):
     """Test creating a rider with valid data — AC1.
@@ -40,7 +41,7 @@ def test_create_rider_fields(client: TestClient):
     
     # Check all expected fields are present
     expected_fields = {"id", "name", "email", "phone"}
-    assert set(data.keys()) == expected_fields
+    assert data.keys() == expected_fields
     
     # Verify types
     assert isinstance(data["id"], str)
@@ -76,6 +77,25 @@ def test_get_rider_rides_not_found(client: TestClient):
     assert "detail" in data
 
 
+def test_get_rider_rides_reflects_status_updates(client: TestClient, accepted_ride):
+    """Test that a rider's history shows a ride's current status, in creation order.
+
+    Expected: the accepted ride is listed as accepted, ahead of a newer ride.
+    """
+    newer = client.post("/api/rides", json={
+        "rider_id": accepted_ride["rider_id"],
+        "pickup_location": "1 New St",
+        "dropoff_location": "2 New St",
+    }).json()
+
+    response = client.get(f"/api/riders/{accepted_ride['rider_id']}/rides")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["id"] for r in data] == [accepted_ride["id"], newer["id"]]
+    assert data[0]["status"] == "accepted"
+
+
 def test_create_multiple_riders(client: TestClient):
     """Test creating multiple riders and verifying they have different IDs.
     
@@ -103,12 +123,8 @@ def test_create_multiple_riders(client: TestClient):
     assert rider1["id"] != rider2["id"]
     
     # Verify both IDs look like UUIDs (standard format)
-    uuid_pattern = re.compile(
-        r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-        re.IGNORECASE
-    )
-    assert uuid_pattern.match(rider1["id"])
-    assert uuid_pattern.match(rider2["id"])
+    assert UUID_RE.match(rider1["id"])
+    assert UUID_RE.match(rider2["id"])
 
 
 def test_rider_id_is_uuid(client: TestClient):
@@ -125,9 +141,4 @@ def test_rider_id_is_uuid(client: TestClient):
     assert response.status_code == 201
     data = response.json()
     
-    # Verify UUID format: 8-4-4-4-12 hexadecimal digits
-    uuid_pattern = re.compile(
-        r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-        re.IGNORECASE
-    )
-    assert uuid_pattern.match(data["id"]), f"ID {data['id']} is not a valid UUID"
+    assert UUID_RE.match(data["id"]), f"ID {data['id']} is not a valid UUID"
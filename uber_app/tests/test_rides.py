@@ -9,9 +9,13 @@ Tests cover:
 - Error cases (404, 409, 403)
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from fastapi.testclient import TestClient
 
+from uber_app import storage
+
 
 class TestRideCreation:
     """Tests for creating rides."""
@@ -216,6 +220,43 @@ class TestRideRetrieval:
         for ride in data:
             assert ride["status"] == "requested"
 
+    def test_list_rides_by_status_follows_transitions(
+        self, client: TestClient, sample_ride: dict, sample_driver: dict
+    ):
+        """A ride is listed under its current status only, across transitions."""
+
+        def ids_with(status: str) -> list:
+            return [r["id"] for r in client.get(f"/api/rides?status={status}").json()]
+
+        ride_id = sample_ride["id"]
+        client.put(f"/api/rides/{ride_id}/accept", json={"driver_id": sample_driver["id"]})
+        assert ids_with("requested") == []
+        assert ids_with("accepted") == [ride_id]
+
+        client.put(f"/api/rides/{ride_id}/cancel")
+        assert ids_with("accepted") == []
+        assert ids_with("requested") == [ride_id]
+        assert ids_with("no-such-status") == []
+
+    def test_list_rides_by_status_in_creation_order(
+        self, client: TestClient, sample_ride: dict, sample_driver: dict
+    ):
+        """A filtered list keeps creation order, even for rides that re-enter a status."""
+        newer = client.post(
+            "/api/rides",
+            json={
+                "rider_id": sample_ride["rider_id"],
+                "pickup_location": "789 Park Ave",
+                "dropoff_location": "999 5th St",
+            },
+        ).json()
+        # The older ride leaves "requested" and comes back after the newer one.
+        client.put(f"/api/rides/{sample_ride['id']}/accept", json={"driver_id": sample_driver["id"]})
+        client.put(f"/api/rides/{sample_ride['id']}/cancel")
+
+        data = client.get("/api/rides?status=requested").json()
+        assert [r["id"] for r in data] == [sample_ride["id"], newer["id"]]
+
     def test_get_rider_rides(self, client: TestClient, sample_rider: dict):
         """Test retrieving all rides for a specific rider (AC4)."""
         # Create multiple rides for the rider
@@ -318,6 +359,55 @@ class TestDriverAcceptRide:
         )
         assert response.status_code == 409
 
+    def test_concurrent_accepts_assign_one_driver(
+        self, client: TestClient, sample_ride: dict
+    ):
+        """Racing accepts on one ride: exactly one wins, the rest get 409."""
+        driver_ids = [
+            client.post(
+                "/api/drivers",
+                json={
+                    "name": f"Driver {i}",
+                    "email": f"driver{i}@example.com",
+                    "phone": f"555-1{i:03d}",
+                    "vehicle_make": "Toyota",
+                    "vehicle_model": "Prius",
+                    "license_plate": f"RACE-{i:03d}",
+                },
+            ).json()["id"]
+            for i in range(8)
+        ]
+
+        def accept(driver_id: str) -> int:
+            return client.put(
+                f"/api/rides/{sample_ride['id']}/accept",
+                json={"driver_id": driver_id},
+            ).status_code
+
+        with ThreadPoolExecutor(max_workers=len(driver_ids)) as pool:
+            codes = list(pool.map(accept, driver_ids))
+
+        assert sorted(codes) == [200] + [409] * (len(driver_ids) - 1)
+        winner = driver_ids[codes.index(200)]
+        assert storage.rides[sample_ride["id"]].driver_id == winner
+        assert [d for d in driver_ids if storage.rides_by_driver.get(d)] == [winner]
+
+    def test_accept_replaces_record_instead_of_mutating(
+        self, client: TestClient, sample_ride: dict, sample_driver: dict
+    ):
+        """A record handed to a reader is never changed under it."""
+        before = storage.rides[sample_ride["id"]]
+        resp = client.put(
+            f"/api/rides/{sample_ride['id']}/accept",
+            json={"driver_id": sample_driver["id"]},
+        )
+        assert resp.status_code == 200
+        assert before.status == "requested"
+        assert before.driver_id is None
+        after = storage.rides[sample_ride["id"]]
+        assert after.status == "accepted"
+        assert storage.rides_by_rider[sample_ride["rider_id"]][sample_ride["id"]] is after
+
 
 class TestRideCompletion:
     """Tests for completing rides."""